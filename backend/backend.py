@@ -12,13 +12,34 @@ import openai
 from aiohttp import web
 from dotenv import load_dotenv
 
-from endpoints import (messages_endpoint_handler, root_endpoint_handler,
+from endpoints import (RESPONSE_CACHE, MessageJournal, TaskSupervisor,
+                       cache_endpoint_handler,
+                       menu_endpoint_handler,
+                       menu_item_delete_endpoint_handler,
+                       menu_item_get_endpoint_handler,
+                       menu_item_put_endpoint_handler,
+                       messages_endpoint_handler, replay_journal,
+                       root_endpoint_handler,
+                       task_delete_endpoint_handler, tasks_endpoint_handler,
+                       tenant_phone_delete_endpoint_handler,
+                       tenant_phone_put_endpoint_handler,
                        webhook_get_endpoint_handler,
-                       webhook_post_endpoint_handler, menu_endpoint_handler)
+                       webhook_post_endpoint_handler)
 
 # Backend expects following env variables:
 # - PORT: If set it will be converted into `int` type to use as port number. If conversion failed,
 #   it will be ignored. If not set or ignored, will default to 8080
+# - TASK_TIMEOUT: If set it will be converted into positive `float` type to use as timeout in
+#   seconds of background jobs. If conversion failed, it will be ignored. If not set or ignored,
+#   will default to 120
+# - RESPONSE_CACHE_THRESHOLD: If set it will be converted into `float` type in range (0, 1] to use
+#   as minimum similarity for cached response to be reused. If conversion failed, it will be
+#   ignored. If not set or ignored, will default to 0.98
+# - JOURNAL_PATH: Path of SQLite database to journal inbound messages to, so they are replayed if
+#   Backend stops before replying. If not set, will default to `journal.db`. If set to empty
+#   value, journaling is disabled
+# - ADMIN_TOKEN: Token that menu and tenants write endpoints, and tasks endpoints expect as bearer
+#   token. If not set, those endpoints are disabled
 load_dotenv()
 
 openai.api_key = os.getenv("OPENAI_API_KEY")
@@ -45,14 +66,59 @@ def serve():
                 port_str,
             )
 
+    task_timeout = 120.0
+
+    if task_timeout_str := os.getenv("TASK_TIMEOUT"):
+        try:
+            task_timeout = float(task_timeout_str)
+            if task_timeout <= 0:
+                raise ValueError(task_timeout_str)
+        except ValueError:
+            task_timeout = 120.0
+            logging.warning(
+                (
+                    "Failed to convert env variable 'TASK_TIMEOUT' of value '%s' to positive "
+                    "'float'. Defaulting to 120"
+                ),
+                task_timeout_str,
+            )
+
+    if threshold_str := os.getenv("RESPONSE_CACHE_THRESHOLD"):
+        try:
+            RESPONSE_CACHE.threshold = float(threshold_str)
+        except ValueError:
+            logging.warning(
+                (
+                    "Failed to convert env variable 'RESPONSE_CACHE_THRESHOLD' of value '%s' to "
+                    "'float' in range (0, 1]. Defaulting to %s"
+                ),
+                threshold_str,
+                RESPONSE_CACHE.threshold,
+            )
+
     app = web.Application()
+    TaskSupervisor(timeout=task_timeout).attach(app)
+
+    if journal_path := os.getenv("JOURNAL_PATH", "journal.db"):
+        MessageJournal(journal_path).attach(app)
+        app.on_startup.append(replay_journal)
     app.add_routes(
         [
             web.get("/", root_endpoint_handler),
             web.get("/webhook", webhook_get_endpoint_handler),
             web.post("/webhook", webhook_post_endpoint_handler),
             web.get("/messages/{phone}", messages_endpoint_handler),
+            web.get("/tasks", tasks_endpoint_handler),
+            web.delete("/tasks/{id}", task_delete_endpoint_handler),
+            web.get("/cache", cache_endpoint_handler),
             web.get("/menu/{phone}", menu_endpoint_handler),
+            web.get("/menu/{phone}/items/{name}", menu_item_get_endpoint_handler),
+            web.put("/menu/{phone}/items/{name}", menu_item_put_endpoint_handler),
+            web.delete("/menu/{phone}/items/{name}", menu_item_delete_endpoint_handler),
+            web.put("/tenants/{tenant}/phones/{phone}", tenant_phone_put_endpoint_handler),
+            web.delete(
+                "/tenants/{tenant}/phones/{phone}", tenant_phone_delete_endpoint_handler
+            ),
         ]
     )
     web.run_app(app, port=port)
@@ -0,0 +1,141 @@
+"""
+Benchmark webhook acknowledgement latency with journaling off, on with group commit, and on with
+one commit per message
+
+Events are posted to webhook POST endpoint handler over HTTP using aiohttp test client and server.
+Message processing spawned by handler is replaced with no-op job, so only acknowledgement is
+measured and no OpenAI API calls are made. Run from `backend` directory using:
+
+    python benchmark_journal.py --requests 5000 --concurrency 64
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from typing import Any, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from endpoints import (MessageJournal, TaskSupervisor,
+                       webhook_post_endpoint_handler)
+
+EVENT = {
+    "entry": [
+        {
+            "changes": [
+                {
+                    "value": {
+                        "messaging_product": "whatsapp",
+                        "messages": [
+                            {
+                                "from": "971556556400",
+                                "timestamp": "1680000000",
+                                "type": "text",
+                                "text": {"body": "What is on the menu today?"},
+                            }
+                        ],
+                    }
+                }
+            ]
+        }
+    ]
+}
+
+
+async def _noop(**_: Any) -> None:
+    pass
+
+
+class AckOnlySupervisor(TaskSupervisor):
+    """
+    Supervisor that spawns no-op job in place of every job it is asked to spawn
+    """
+
+    def spawn(self, coro_func, /, *, name, timeout=None, **kwargs) -> None:
+        super().spawn(_noop, name=name, timeout=timeout)
+
+
+def create_app(journal_path: Optional[str], *, batch_size: int) -> web.Application:
+    """
+    Application with webhook POST endpoint, journaling to `journal_path` if set
+    """
+
+    app = web.Application()
+    AckOnlySupervisor().attach(app)
+    if journal_path:
+        MessageJournal(journal_path, batch_size=batch_size).attach(app)
+    app.add_routes([web.post("/webhook", webhook_post_endpoint_handler)])
+
+    return app
+
+
+async def run(
+    app: web.Application, *, requests: int, concurrency: int
+) -> tuple[float, list[float]]:
+    """
+    Post `requests` events with up to `concurrency` in flight. Returns total seconds and latency of
+    every acknowledgement
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async with TestClient(TestServer(app)) as client:
+
+        async def ack() -> float:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.post("/webhook", json=EVENT)
+                await response.release()
+                if response.status != 200:
+                    raise RuntimeError(f"Unexpected status {response.status}")
+                return time.perf_counter() - started
+
+        started = time.perf_counter()
+        latencies = await asyncio.gather(*[ack() for _ in range(requests)])
+
+        return time.perf_counter() - started, list(latencies)
+
+
+async def main(*, requests: int, concurrency: int) -> None:
+    """
+    Run benchmark for every mode and print results
+    """
+
+    print(f"{'journal':<24}{'acks/s':>10}{'p50 ms':>10}{'p99 ms':>10}")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for mode, batch_size in (
+            ("off", 0),
+            ("on, group commit", 512),
+            ("on, no group commit", 1),
+        ):
+            journal_path = (
+                os.path.join(directory, f"{batch_size}.db") if batch_size else None
+            )
+            app = create_app(journal_path, batch_size=batch_size)
+
+            total, latencies = await run(
+                app, requests=requests, concurrency=concurrency
+            )
+
+            percentiles = statistics.quantiles(latencies, n=100)
+            print(
+                f"{mode:<24}{requests / total:>10.0f}"
+                f"{percentiles[49] * 1000:>10.3f}{percentiles[98] * 1000:>10.3f}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", 1)[0].strip())
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=64)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    asyncio.run(main(requests=args.requests, concurrency=args.concurrency))
@@ -4,16 +4,37 @@ Endpoints Module
 Houses endpoints handlers and shared utilities
 """
 
-from ._menu import menu_endpoint_handler
+from ._cache import cache_endpoint_handler
+from ._journal import MessageJournal
+from ._menu import (menu_endpoint_handler, menu_item_delete_endpoint_handler,
+                    menu_item_get_endpoint_handler,
+                    menu_item_put_endpoint_handler,
+                    tenant_phone_delete_endpoint_handler,
+                    tenant_phone_put_endpoint_handler)
 from ._messages import messages_endpoint_handler
 from ._root import root_endpoint_handler
-from ._webhook import (webhook_get_endpoint_handler,
+from ._shared import RESPONSE_CACHE
+from ._supervisor import TaskSupervisor
+from ._tasks import task_delete_endpoint_handler, tasks_endpoint_handler
+from ._webhook import (replay_journal, webhook_get_endpoint_handler,
                        webhook_post_endpoint_handler)
 
 __all__ = [
+    "RESPONSE_CACHE",
+    "MessageJournal",
+    "TaskSupervisor",
+    "cache_endpoint_handler",
     "menu_endpoint_handler",
+    "menu_item_delete_endpoint_handler",
+    "menu_item_get_endpoint_handler",
+    "menu_item_put_endpoint_handler",
     "messages_endpoint_handler",
+    "replay_journal",
     "root_endpoint_handler",
+    "task_delete_endpoint_handler",
+    "tasks_endpoint_handler",
+    "tenant_phone_delete_endpoint_handler",
+    "tenant_phone_put_endpoint_handler",
     "webhook_get_endpoint_handler",
     "webhook_post_endpoint_handler",
 ]
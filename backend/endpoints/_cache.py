@@ -0,0 +1,21 @@
+"""
+Endpoint '/cache' handler
+"""
+
+import json
+
+from aiohttp.web import Response
+
+from ._shared import RESPONSE_CACHE
+
+
+async def cache_endpoint_handler(_):
+    """
+    Handler for cache endpoint. Lists response cache hit rate, seconds saved and size. Used for
+    debugging. NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    return Response(
+        headers={"Content-Type": "application/json; charset=utf-8"},
+        text=json.dumps(RESPONSE_CACHE.stats()),
+    )
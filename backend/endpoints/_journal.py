@@ -0,0 +1,318 @@
+"""
+Durable inbound message journal
+
+Inbound messages are appended to a SQLite journal in WAL mode before webhook event is acknowledged,
+and marked as completed once reply is sent. Messages not completed before Backend stopped are
+recovered on next start to be replayed
+"""
+
+import asyncio
+import logging
+import queue
+import sqlite3
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Optional
+
+if TYPE_CHECKING:
+    from aiohttp.web import Application
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS inbound (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    phone_number TEXT NOT NULL,
+    message TEXT NOT NULL,
+    received REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS completed (
+    inbound_id INTEGER PRIMARY KEY,
+    completed REAL NOT NULL
+);
+"""
+
+# Operation executed by writer thread against journal connection, with loop and future to resolve
+# with its result. Completions are fire-and-forget and have neither
+_Operation = tuple[
+    Callable[[sqlite3.Connection], Any],
+    Optional[asyncio.AbstractEventLoop],
+    Optional["asyncio.Future[Any]"],
+]
+
+
+class JournalEntry:
+    # pylint: disable=too-few-public-methods
+    """
+    Inbound message recorded in :class:`MessageJournal`
+    """
+
+    entry_id: int
+    phone_number: str
+    message: str
+
+    def __init__(
+        self,
+        journal: "MessageJournal",
+        *,
+        entry_id: int,
+        phone_number: str,
+        message: str
+    ):
+        self.__journal = journal
+        self.entry_id = entry_id
+        self.phone_number = phone_number
+        self.message = message
+
+    def complete(self) -> None:
+        """
+        Mark entry as completed so it isn't replayed. Safe to call from any thread
+        """
+
+        self.__journal.complete(self.entry_id)
+
+
+class MessageJournal:
+    """
+    Append-only journal of inbound messages backed by SQLite in WAL mode
+
+    All writes go through single writer thread. Writes queued while a commit is in progress are
+    committed together in next transaction (group commit), so one fsync is shared by up to
+    `batch_size` writes. Completed entries are deleted every `compact_every` transactions and on
+    close. Bind to app lifecycle using :meth:`attach`
+    """
+
+    __path: str
+    __batch_size: int
+    __compact_every: int
+    __queue: "queue.SimpleQueue[Optional[_Operation]]"
+    __lock: threading.Lock
+    __writer: Optional[threading.Thread]
+
+    def __init__(self, path: str, *, batch_size: int = 512, compact_every: int = 1000):
+        self.__path = path
+        self.__batch_size = batch_size
+        self.__compact_every = compact_every
+        self.__queue = queue.SimpleQueue()
+        # Guards writer against being stopped between check and put of completion
+        self.__lock = threading.Lock()
+        self.__writer = None
+
+    def attach(self, app: "Application") -> None:
+        """
+        Store journal as `app["journal"]`, open it with app, and close it on app cleanup. Cleanup
+        runs after app shutdown, in which :class:`TaskSupervisor` waits for its worker threads, so
+        completions from those threads are committed before journal is closed
+        """
+
+        async def on_startup(_):
+            await self.open()
+
+        async def on_cleanup(_):
+            await self.close()
+
+        app["journal"] = self
+        app.on_startup.append(on_startup)
+        app.on_cleanup.append(on_cleanup)
+
+    async def open(self) -> None:
+        """
+        Open journal database, creating it if it doesn't exist, and start writer thread
+        """
+
+        connection = await asyncio.to_thread(self.__connect)
+        self.__writer = threading.Thread(
+            target=self.__write, args=(connection,), name="journal-writer", daemon=True
+        )
+        self.__writer.start()
+
+    async def close(self) -> None:
+        """
+        Commit queued writes, stop writer thread and close journal database. Completions after
+        that are dropped, so their entries are replayed on next start
+        """
+
+        with self.__lock:
+            writer, self.__writer = self.__writer, None
+            if writer is None:
+                return
+            self.__queue.put(None)
+
+        await asyncio.to_thread(writer.join)
+
+    async def append(self, *, phone_number: str, message: str) -> JournalEntry:
+        """
+        Append inbound message to journal. Returns once entry is committed
+
+        :raises sqlite3.Error: If failed to commit entry
+        """
+
+        def insert(connection: sqlite3.Connection) -> int:
+            cursor = connection.execute(
+                "INSERT INTO inbound (phone_number, message, received) VALUES (?, ?, ?)",
+                (phone_number, message, time.time()),
+            )
+            return cursor.lastrowid or 0
+
+        entry_id = await self.__submit(insert)
+
+        return JournalEntry(
+            self, entry_id=entry_id, phone_number=phone_number, message=message
+        )
+
+    def complete(self, entry_id: int) -> None:
+        """
+        Mark entry as completed. Doesn't wait for commit. Safe to call from any thread
+        """
+
+        def insert(connection: sqlite3.Connection) -> None:
+            connection.execute(
+                "INSERT OR IGNORE INTO completed (inbound_id, completed) VALUES (?, ?)",
+                (entry_id, time.time()),
+            )
+
+        with self.__lock:
+            if self.__writer is None:
+                logging.warning(
+                    "Journal is closed, entry %s will be replayed on next start",
+                    entry_id,
+                )
+                return
+            self.__queue.put((insert, None, None))
+
+    async def recover(self, *, max_age: float = 86400) -> list[JournalEntry]:
+        """
+        Entries not completed, oldest first. Entries older than `max_age` seconds are marked as
+        completed instead, as reply to them is no longer useful. Completed entries are compacted
+        """
+
+        def select(connection: sqlite3.Connection) -> list[tuple[int, str, str]]:
+            connection.execute(
+                (
+                    "INSERT INTO completed (inbound_id, completed) SELECT id, ? FROM inbound "
+                    "WHERE received < ? AND id NOT IN (SELECT inbound_id FROM completed)"
+                ),
+                (time.time(), time.time() - max_age),
+            )
+            _compact(connection)
+            return connection.execute(
+                "SELECT id, phone_number, message FROM inbound ORDER BY id"
+            ).fetchall()
+
+        return [
+            JournalEntry(
+                self, entry_id=entry_id, phone_number=phone_number, message=message
+            )
+            for entry_id, phone_number, message in await self.__submit(select)
+        ]
+
+    async def __submit(self, operation: Callable[[sqlite3.Connection], Any]) -> Any:
+        if self.__writer is None:
+            raise RuntimeError("MessageJournal is not open")
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.__queue.put((operation, loop, future))
+
+        return await future
+
+    def __connect(self) -> sqlite3.Connection:
+        # Connection is created here and used only by writer thread afterwards
+        connection = sqlite3.connect(
+            self.__path, isolation_level=None, check_same_thread=False
+        )
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=FULL")
+        connection.executescript(SCHEMA)
+
+        return connection
+
+    def __write(self, connection: sqlite3.Connection) -> None:
+        closing = False
+        transactions = 0
+
+        while not closing:
+            # Block for first operation, then take whatever else queued up meanwhile
+            operations = [self.__queue.get()]
+            while len(operations) < self.__batch_size:
+                try:
+                    operations.append(self.__queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing = None in operations
+            batch = [operation for operation in operations if operation is not None]
+            results: list[tuple[_Operation, Any, Optional[BaseException]]] = []
+
+            # Any error is reported to operation it belongs to, as writer thread must survive it
+            # for later operations not to wait forever
+            try:
+                connection.execute("BEGIN")
+                for operation in batch:
+                    try:
+                        results.append((operation, operation[0](connection), None))
+                    except Exception as e:  # pylint: disable=broad-except
+                        results.append((operation, None, e))
+                connection.execute("COMMIT")
+            except Exception as e:  # pylint: disable=broad-except
+                logging.error("Failed to commit journal with error: %s", e)
+                if connection.in_transaction:
+                    try:
+                        connection.execute("ROLLBACK")
+                    except sqlite3.Error:
+                        pass
+                results = [(operation, None, e) for operation in batch]
+
+            self.__report(results)
+
+            transactions += 1
+            if closing or transactions % self.__compact_every == 0:
+                self.__compact(connection)
+
+        connection.close()
+
+    @staticmethod
+    def __report(
+        results: list[tuple[_Operation, Any, Optional[BaseException]]]
+    ) -> None:
+        for (_, loop, future), result, error in results:
+            if loop is not None and future is not None:
+                try:
+                    loop.call_soon_threadsafe(_resolve, future, result, error)
+                except RuntimeError:
+                    # Loop closed while operation was queued, nobody awaits its result
+                    pass
+            elif error is not None:
+                logging.error("Failed to write journal with error: %s", error)
+
+    @staticmethod
+    def __compact(connection: sqlite3.Connection) -> None:
+        try:
+            connection.execute("BEGIN")
+            _compact(connection)
+            connection.execute("COMMIT")
+        except sqlite3.Error as e:
+            logging.error("Failed to compact journal with error: %s", e)
+            if connection.in_transaction:
+                try:
+                    connection.execute("ROLLBACK")
+                except sqlite3.Error:
+                    pass
+
+
+def _compact(connection: sqlite3.Connection) -> None:
+    # Completed entries are no longer needed once they are removed from inbound
+    connection.execute(
+        "DELETE FROM inbound WHERE id IN (SELECT inbound_id FROM completed)"
+    )
+    connection.execute("DELETE FROM completed")
+
+
+def _resolve(
+    future: "asyncio.Future[Any]", result: Any, error: Optional[BaseException]
+) -> None:
+    if future.done():
+        return
+
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
@@ -1,22 +1,86 @@
 """
-Endpoint '/menu/{phone}' handler
+Endpoints '/menu/{phone}', '/menu/{phone}/items/{name}' and '/tenants/{tenant}/phones/{phone}'
+handlers
 """
 
 import json
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 from aiohttp.web import Response
 
-from ._shared import MENU
+from ._menu_index import RANGE_KEYS, InvalidMenuItem
+from ._shared import MENU, is_admin_request
 
 if TYPE_CHECKING:
     from aiohttp.web import Request
 
+    from ._menu_index import RangeKey
+
 
 async def menu_endpoint_handler(request: "Request") -> "Response":
     """
-    Handler for menu endpoint. Lists menu items created by certain number. Used for
-    debugging. NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    Handler for menu endpoint. Lists menu items of tenant of certain number. Used for debugging.
+    NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+
+    Items can be filtered by any combination of following query parameters:
+    - `name`: Fuzzy match against item name, best match first
+    - `type`: Exact match against item type
+    - `min_unit_price`, `max_unit_price`, `min_preparation_time`, `max_preparation_time`: Range
+      match, sorted by matched value unless filtered by `name` too
+    """
+
+    phone = request.match_info["phone"]
+
+    if phone not in MENU:
+        return Response(status=400, text="Phone is invalid")
+
+    ranges: dict["RangeKey", tuple[Optional[int], Optional[int]]] = {}
+    for key in RANGE_KEYS:
+        try:
+            low = _optional_int(request.query.get(f"min_{key}"))
+            high = _optional_int(request.query.get(f"max_{key}"))
+        except ValueError:
+            return Response(status=400, text=f"Range of '{key}' is invalid")
+
+        if low is not None or high is not None:
+            ranges[key] = (low, high)
+
+    name = request.query.get("name")
+    item_type = request.query.get("type")
+
+    if not (name or item_type or ranges):
+        return Response(
+            headers={"Content-Type": "application/json; charset=utf-8"},
+            text=MENU.dumps(phone),
+        )
+
+    # Query most selective index available, then apply remaining filters to its result
+    if name:
+        items = MENU.search(phone, name)
+    elif ranges:
+        key, (low, high) = next(iter(ranges.items()))
+        items = MENU.in_range(phone, key, low=low, high=high)
+    else:
+        items = MENU.by_type(phone, item_type or "")
+
+    return _json_response(
+        [
+            item
+            for item in items
+            if (not item_type or item["type"] == item_type)
+            and all(
+                (low is None or item[key] >= low)
+                and (high is None or item[key] <= high)
+                for key, (low, high) in ranges.items()
+            )
+        ]
+    )
+
+
+async def menu_item_get_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for menu item GET endpoint. Gets item of exact name. NOT SUPPOSED TO BE INVOKED OUTSIDE
+    OF AIOHTTP CONTEXT
     """
 
     phone = request.match_info["phone"]
@@ -24,7 +88,100 @@ async def menu_endpoint_handler(request: "Request") -> "Response":
     if phone not in MENU:
         return Response(status=400, text="Phone is invalid")
 
+    if not (item := MENU.get(phone, request.match_info["name"])):
+        return Response(status=404, text="Item not found")
+
+    return _json_response(item)
+
+
+async def menu_item_put_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for menu item PUT endpoint. Creates or replaces item of name. Requires admin token.
+    NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not is_admin_request(request):
+        return Response(status=403, text="Invalid token")
+
+    phone = request.match_info["phone"]
+
+    try:
+        item_dict = await request.json()
+    except json.JSONDecodeError:
+        return Response(status=400, text="Invalid item")
+
+    if not isinstance(item_dict, dict):
+        return Response(status=400, text="Invalid item")
+
+    try:
+        item = MENU.upsert(phone, {**item_dict, "name": request.match_info["name"]})
+    except InvalidMenuItem as e:
+        return Response(status=400, text=f"Invalid item: {e}")
+
+    return _json_response(item)
+
+
+async def menu_item_delete_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for menu item DELETE endpoint. Deletes item of name. Requires admin token. NOT SUPPOSED
+    TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not is_admin_request(request):
+        return Response(status=403, text="Invalid token")
+
+    phone = request.match_info["phone"]
+
+    if phone not in MENU:
+        return Response(status=400, text="Phone is invalid")
+
+    if not (item := MENU.delete(phone, request.match_info["name"])):
+        return Response(status=404, text="Item not found")
+
+    return _json_response(item)
+
+
+async def tenant_phone_put_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for tenant phone PUT endpoint. Maps phone to tenant so it shares tenant menu. Requires
+    admin token. NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not is_admin_request(request):
+        return Response(status=403, text="Invalid token")
+
+    tenant = request.match_info["tenant"]
+    MENU.assign_phone(tenant_id=tenant, phone_number=request.match_info["phone"])
+
+    return _json_response(MENU.phones(tenant))
+
+
+async def tenant_phone_delete_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for tenant phone DELETE endpoint. Unmaps phone from tenant. Requires admin token. NOT
+    SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not is_admin_request(request):
+        return Response(status=403, text="Invalid token")
+
+    tenant = request.match_info["tenant"]
+    phone = request.match_info["phone"]
+
+    if MENU.tenant_id(phone) != tenant:
+        return Response(status=404, text="Phone is not mapped to tenant")
+
+    MENU.unassign_phone(phone)
+
+    return _json_response(MENU.phones(tenant))
+
+
+def _optional_int(value: Optional[str]) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _json_response(value) -> "Response":
     return Response(
         headers={"Content-Type": "application/json; charset=utf-8"},
-        text=json.dumps(MENU[phone]),
+        text=json.dumps(value),
     )
@@ -0,0 +1,349 @@
+"""
+Multi-tenant menu index
+
+Menus belong to tenants (restaurants) rather than to phone numbers. Many staff phone numbers can be
+mapped to one tenant, and a phone number that was never mapped acts as its own tenant
+"""
+
+import difflib
+import json
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import TYPE_CHECKING, Any, Literal, Mapping, Optional
+
+if TYPE_CHECKING:
+    from ._shared import Item
+
+RangeKey = Literal["unit_price", "preparation_time"]
+
+ITEM_TYPES = ("dish", "sandwich", "drink")
+RANGE_KEYS: tuple[RangeKey, ...] = ("unit_price", "preparation_time")
+
+
+class InvalidMenuItem(Exception):
+    """
+    Raised by MenuIndex if item dict is missing keys or has values of wrong type
+    """
+
+
+def normalise_name(name: str) -> str:
+    """
+    Normalise item name for lookups. Case and surrounding or repeated whitespace are ignored
+    """
+
+    return " ".join(name.casefold().split())
+
+
+def validate_item(item: Mapping[str, Any]) -> "Item":
+    """
+    Validate item dict and return copy of it limited to keys of :class:`Item`
+
+    :raises InvalidMenuItem: If any key is missing or has value of wrong type
+    """
+
+    try:
+        name = item["name"]
+        item_type = item["type"]
+        unit_price = item["unit_price"]
+        preparation_time = item["preparation_time"]
+    except (KeyError, TypeError) as e:
+        raise InvalidMenuItem("Failed to extract item values from 'item' dict") from e
+
+    if not isinstance(name, str) or not normalise_name(name):
+        raise InvalidMenuItem("Value of 'name' should be non-empty 'str'")
+
+    if item_type not in ITEM_TYPES:
+        raise InvalidMenuItem(f"Unknown value '{item_type}' for 'type'")
+
+    for key, value in (
+        ("unit_price", unit_price),
+        ("preparation_time", preparation_time),
+    ):
+        if isinstance(value, bool) or not isinstance(value, int) or value < 0:
+            raise InvalidMenuItem(f"Value of '{key}' should be non-negative 'int'")
+
+    return {
+        "name": name.strip(),
+        "type": item_type,
+        "unit_price": unit_price,
+        "preparation_time": preparation_time,
+    }
+
+
+class TenantMenu:
+    """
+    Menu of single tenant with items indexed by normalised name, by type, and sorted by each of
+    :data:`RANGE_KEYS` for range queries. All indexes are updated incrementally on every change
+
+    Not thread-safe on its own. Access it through :class:`MenuIndex`
+    """
+
+    __items: dict[str, "Item"]
+    __types: dict[str, dict[str, None]]
+    __ranges: dict[RangeKey, list[tuple[int, str]]]
+    __json: Optional[str]
+
+    def __init__(self):
+        self.__items = {}
+        self.__types = {item_type: {} for item_type in ITEM_TYPES}
+        self.__ranges = {key: [] for key in RANGE_KEYS}
+        self.__json = None
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def items(self) -> list["Item"]:
+        """
+        List of items in order they were first added
+        """
+
+        return [item.copy() for item in self.__items.values()]
+
+    def dumps(self) -> str:
+        """
+        JSON serialisation of :meth:`items`. Cached until next change to menu
+        """
+
+        if self.__json is None:
+            self.__json = json.dumps(list(self.__items.values()))
+
+        return self.__json
+
+    def get(self, name: str) -> Optional["Item"]:
+        """
+        Item of exact (normalised) name, or `None`
+        """
+
+        item = self.__items.get(normalise_name(name))
+        return item.copy() if item else None
+
+    def by_type(self, item_type: str) -> list["Item"]:
+        """
+        Items of type `item_type`
+        """
+
+        return [self.__items[key].copy() for key in self.__types.get(item_type, {})]
+
+    def search(self, name: str, *, limit: int = 3, cutoff: float = 0.6) -> list["Item"]:
+        """
+        Items of names closest to `name`, best match first. Exact match is always returned first
+        """
+
+        key = normalise_name(name)
+        keys = difflib.get_close_matches(
+            key, self.__items.keys(), n=limit, cutoff=cutoff
+        )
+        if key in self.__items and key not in keys:
+            keys = [key] + keys[: limit - 1]
+
+        return [self.__items[key].copy() for key in keys]
+
+    def in_range(
+        self, key: RangeKey, *, low: Optional[int] = None, high: Optional[int] = None
+    ) -> list["Item"]:
+        """
+        Items with value of `key` between `low` and `high`, both inclusive, sorted by that value
+        """
+
+        entries = self.__ranges[key]
+        start = 0 if low is None else bisect_left(entries, low, key=lambda e: e[0])
+        end = (
+            len(entries)
+            if high is None
+            else bisect_right(entries, high, key=lambda e: e[0])
+        )
+
+        return [self.__items[name].copy() for _, name in entries[start:end]]
+
+    def upsert(self, item: Mapping[str, Any]) -> "Item":
+        """
+        Add item, or replace item of same (normalised) name
+
+        :raises InvalidMenuItem: If item is invalid
+        """
+
+        valid_item = validate_item(item)
+        key = normalise_name(valid_item["name"])
+
+        if (old_item := self.__items.get(key)) is not None:
+            # Replaced item keeps its position in type index unless its type changed
+            self.__unindex(
+                key, old_item, keep_type=old_item["type"] == valid_item["type"]
+            )
+
+        self.__items[key] = valid_item
+        self.__types[valid_item["type"]][key] = None
+        for range_key in RANGE_KEYS:
+            insort(self.__ranges[range_key], (valid_item[range_key], key))
+        self.__json = None
+
+        return valid_item.copy()
+
+    def delete(self, name: str) -> Optional["Item"]:
+        """
+        Delete item of (normalised) name. Returns deleted item, or `None` if there was none
+        """
+
+        key = normalise_name(name)
+        if key not in self.__items:
+            return None
+
+        item = self.__items.pop(key)
+        self.__unindex(key, item)
+        self.__json = None
+
+        return item
+
+    def __unindex(self, key: str, item: "Item", *, keep_type: bool = False) -> None:
+        if not keep_type:
+            del self.__types[item["type"]][key]
+        for range_key in RANGE_KEYS:
+            entries = self.__ranges[range_key]
+            del entries[bisect_left(entries, (item[range_key], key))]
+
+
+class MenuIndex:
+    """
+    Thread-safe registry of :class:`TenantMenu` objects. Every method accepts a phone number and
+    resolves it to its tenant first
+    """
+
+    __lock: threading.RLock
+    __tenants: dict[str, TenantMenu]
+    __phones: dict[str, str]
+
+    def __init__(self):
+        self.__lock = threading.RLock()
+        self.__tenants = {}
+        self.__phones = {}
+
+    def __contains__(self, phone_number: str) -> bool:
+        with self.__lock:
+            return self.tenant_id(phone_number) in self.__tenants
+
+    def tenant_id(self, phone_number: str) -> str:
+        """
+        Tenant phone number is mapped to. Unmapped phone number is its own tenant
+        """
+
+        with self.__lock:
+            return self.__phones.get(phone_number, phone_number)
+
+    def assign_phone(self, *, tenant_id: str, phone_number: str) -> None:
+        """
+        Map phone number to tenant, creating tenant if it doesn't exist. Menu the phone number had
+        as its own tenant is left as is
+        """
+
+        with self.__lock:
+            self.__phones[phone_number] = tenant_id
+            self.__tenants.setdefault(tenant_id, TenantMenu())
+
+    def unassign_phone(self, phone_number: str) -> None:
+        """
+        Remove phone number mapping. Phone number becomes its own tenant again
+        """
+
+        with self.__lock:
+            self.__phones.pop(phone_number, None)
+
+    def phones(self, tenant_id: str) -> list[str]:
+        """
+        Phone numbers mapped to tenant
+        """
+
+        with self.__lock:
+            return [
+                phone for phone, tenant in self.__phones.items() if tenant == tenant_id
+            ]
+
+    def ensure(self, phone_number: str) -> None:
+        """
+        Create empty menu for tenant of phone number if it has none
+        """
+
+        with self.__lock:
+            self.__tenants.setdefault(self.tenant_id(phone_number), TenantMenu())
+
+    def items(self, phone_number: str) -> list["Item"]:
+        """
+        Mirror :meth:`TenantMenu.items`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).items()
+
+    def dumps(self, phone_number: str) -> str:
+        """
+        Mirror :meth:`TenantMenu.dumps`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).dumps()
+
+    def get(self, phone_number: str, name: str) -> Optional["Item"]:
+        """
+        Mirror :meth:`TenantMenu.get`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).get(name)
+
+    def by_type(self, phone_number: str, item_type: str) -> list["Item"]:
+        """
+        Mirror :meth:`TenantMenu.by_type`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).by_type(item_type)
+
+    def search(
+        self, phone_number: str, name: str, *, limit: int = 3, cutoff: float = 0.6
+    ) -> list["Item"]:
+        """
+        Mirror :meth:`TenantMenu.search`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).search(name, limit=limit, cutoff=cutoff)
+
+    def in_range(
+        self,
+        phone_number: str,
+        key: RangeKey,
+        *,
+        low: Optional[int] = None,
+        high: Optional[int] = None,
+    ) -> list["Item"]:
+        """
+        Mirror :meth:`TenantMenu.in_range`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).in_range(key, low=low, high=high)
+
+    def upsert(self, phone_number: str, item: Mapping[str, Any]) -> "Item":
+        """
+        Mirror :meth:`TenantMenu.upsert`. Creates tenant menu if it has none
+
+        :raises InvalidMenuItem: If item is invalid
+        """
+
+        with self.__lock:
+            self.ensure(phone_number)
+            return self.__tenant(phone_number).upsert(item)
+
+    def delete(self, phone_number: str, name: str) -> Optional["Item"]:
+        """
+        Mirror :meth:`TenantMenu.delete`
+        """
+
+        with self.__lock:
+            return self.__tenant(phone_number).delete(name)
+
+    def __tenant(self, phone_number: str) -> TenantMenu:
+        """
+        :raises KeyError: If tenant of phone number has no menu
+        """
+
+        return self.__tenants[self.tenant_id(phone_number)]
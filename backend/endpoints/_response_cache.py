@@ -0,0 +1,187 @@
+"""
+Semantic response cache
+
+Caches responses to context-free questions by embedding of the question. A cached response is
+reused for any question whose embedding is similar enough, as long as it was cached against same
+menu state and same words in question, ignoring stopwords, and hasn't expired
+"""
+
+import hashlib
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Sequence
+
+import numpy as np
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+STOPWORDS = frozenset(
+    (
+        "a an and any are be can could do does did for have has i in is it me my of on or our "
+        "please the there this that to was we were what which with would you your"
+    ).split()
+)
+
+
+def cache_key(*, menu_json: str, message: str) -> int:
+    """
+    Hash menu JSON serialisation and words of message, in order and without stopwords, into key
+    that cached responses are bound to. Embeddings of messages differing only in a name or number,
+    e.g. "add pizza" and "add pasta", are too similar to tell apart, so such messages never share
+    a response
+    """
+
+    words = " ".join(
+        token
+        for token in TOKEN_PATTERN.findall(message.casefold())
+        if token not in STOPWORDS
+    )
+    digest = hashlib.sha256(f"{menu_json}\0{words}".encode()).digest()
+
+    return int.from_bytes(digest[:8], "big", signed=True)
+
+
+class ResponseCache:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Thread-safe nearest-neighbour cache of responses. Embeddings are kept normalised in a NumPy
+    matrix so lookup is a single matrix-vector product. Entries expire after `ttl` seconds, and
+    least recently used entry is evicted once cache holds `max_size` entries
+    """
+
+    __threshold: float
+    __ttl: float
+    __max_size: int
+    __lock: threading.Lock
+    __vectors: Optional[np.ndarray]
+    __expires: np.ndarray
+    __keys: np.ndarray
+    __responses: list[Optional[str]]
+    __latencies: list[float]
+    __lru: OrderedDict[int, None]
+    __counts: dict[str, Any]
+
+    def __init__(
+        self, *, threshold: float = 0.98, ttl: float = 3600, max_size: int = 1024
+    ):
+        self.threshold = threshold
+        self.__ttl = ttl
+        self.__max_size = max_size
+        self.__lock = threading.Lock()
+        # Allocated on first store, once embeddings dimension is known
+        self.__vectors = None
+        self.__expires = np.zeros(max_size, dtype=np.float64)
+        self.__keys = np.zeros(max_size, dtype=np.int64)
+        self.__responses = [None] * max_size
+        self.__latencies = [0.0] * max_size
+        self.__lru = OrderedDict()
+        self.__counts = {"lookups": 0, "hits": 0, "latency_saved": 0.0}
+
+    @property
+    def threshold(self) -> float:
+        """
+        Minimum cosine similarity of embeddings for cached response to be reused
+        """
+
+        return self.__threshold
+
+    @threshold.setter
+    def threshold(self, threshold: float) -> None:
+        if not 0 < threshold <= 1:
+            raise ValueError("Value of 'threshold' should be in range (0, 1]")
+
+        self.__threshold = threshold
+
+    def lookup(self, embedding: Sequence[float], *, key: int) -> Optional[str]:
+        """
+        Response cached for most similar embedding under key `key`, or `None` if there's no entry
+        with similarity of at least `threshold`
+        """
+
+        with self.__lock:
+            self.__counts["lookups"] += 1
+
+            if (slot := self.__nearest(self.__normalise(embedding), key)) is None:
+                return None
+
+            self.__lru.move_to_end(slot)
+            self.__counts["hits"] += 1
+            self.__counts["latency_saved"] += self.__latencies[slot]
+
+            return self.__responses[slot]
+
+    def store(
+        self, embedding: Sequence[float], *, key: int, response: str, latency: float
+    ) -> None:
+        """
+        Cache response for embedding under key `key`. `latency` is seconds it took to generate
+        response, and is counted as saved on every hit. Replaces entry of similar embedding if
+        there is one
+        """
+
+        vector = self.__normalise(embedding)
+
+        with self.__lock:
+            if self.__vectors is None:
+                self.__vectors = np.zeros(
+                    (self.__max_size, vector.shape[0]), dtype=np.float32
+                )
+
+            if (slot := self.__nearest(vector, key)) is None:
+                slot = self.__free_slot()
+
+            self.__vectors[slot] = vector
+            self.__expires[slot] = time.monotonic() + self.__ttl
+            self.__keys[slot] = key
+            self.__responses[slot] = response
+            self.__latencies[slot] = latency
+            self.__lru[slot] = None
+            self.__lru.move_to_end(slot)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Counts of lookups and hits, hit rate, total seconds saved, and current size
+        """
+
+        with self.__lock:
+            lookups = self.__counts["lookups"]
+            return {
+                **self.__counts,
+                "misses": lookups - self.__counts["hits"],
+                "hit_rate": self.__counts["hits"] / lookups if lookups else 0.0,
+                "size": int((self.__expires > time.monotonic()).sum()),
+                "max_size": self.__max_size,
+            }
+
+    def __nearest(self, vector: np.ndarray, key: int) -> Optional[int]:
+        if self.__vectors is None:
+            return None
+
+        valid = (self.__expires > time.monotonic()) & (self.__keys == key)
+        if not valid.any():
+            return None
+
+        similarities = self.__vectors @ vector
+        similarities[~valid] = -np.inf
+        slot = int(similarities.argmax())
+
+        return slot if similarities[slot] >= self.__threshold else None
+
+    def __free_slot(self) -> int:
+        # Prefer never used or expired slot, else evict least recently used
+        free = np.flatnonzero(self.__expires <= time.monotonic())
+        if free.size:
+            slot = int(free[0])
+            self.__lru.pop(slot, None)
+            return slot
+
+        slot, _ = self.__lru.popitem(last=False)
+        return slot
+
+    @staticmethod
+    def __normalise(embedding: Sequence[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
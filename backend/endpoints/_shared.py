@@ -1,4 +1,27 @@
-from typing import Literal, TypedDict
+import hmac
+import os
+from typing import TYPE_CHECKING, Literal, TypedDict
+
+from ._menu_index import MenuIndex
+from ._response_cache import ResponseCache
+
+if TYPE_CHECKING:
+    from aiohttp.web import Request
+
+
+def is_admin_request(request: "Request") -> bool:
+    """
+    Check request carries admin token set with env variable `ADMIN_TOKEN` as bearer token. Always
+    `False` if `ADMIN_TOKEN` isn't set, so admin endpoints are disabled by default
+    """
+
+    if not (admin_token := os.getenv("ADMIN_TOKEN")):
+        return False
+
+    return hmac.compare_digest(
+        request.headers.get("Authorization", "").encode(),
+        f"Bearer {admin_token}".encode(),
+    )
 
 
 class Message(TypedDict):
@@ -21,27 +44,30 @@ class Item(TypedDict):
     preparation_time: int
 
 
-MENU: dict[str, list[Item]] = {
-    "971556556400": [
-        {
-            "name": "Spaghetti",
-            "type": "dish",
-            "unit_price": 3400,
-            "preparation_time": 25,
-        },
-        {
-            "name": "golden burger",
-            "type": "sandwich",
-            "unit_price": 1200,
-            "preparation_time": 4,
-        },
-        {
-            "name": "Mashawi Plate",
-            "type": "dish",
-            "unit_price": 7500,
-            "preparation_time": 30,
-        },
-    ]
-}
+MENU = MenuIndex()
+
+for _item in [
+    {
+        "name": "Spaghetti",
+        "type": "dish",
+        "unit_price": 3400,
+        "preparation_time": 25,
+    },
+    {
+        "name": "golden burger",
+        "type": "sandwich",
+        "unit_price": 1200,
+        "preparation_time": 4,
+    },
+    {
+        "name": "Mashawi Plate",
+        "type": "dish",
+        "unit_price": 7500,
+        "preparation_time": 30,
+    },
+]:
+    MENU.upsert("971556556400", _item)
+
+RESPONSE_CACHE = ResponseCache()
 
 ITEM_CREATE_VICTOR = [-0.010082613676786423, -0.007755856495350599, -0.023854147642850876, -0.031518757343292236, -0.02374986745417118, 0.013171921484172344, -0.015720274299383163, -0.030267393216490746, 0.0012155186850577593, -0.029094239696860313, 0.02563994936645031, -0.01770160160958767, -0.00930051039904356, -0.025314074009656906, -0.0034054077696055174, -0.028025364503264427, 0.02639598213136196, 0.018144793808460236, 0.014338558539748192, -0.0049500614404678345, -0.0025630174204707146, -0.002059538383036852, 0.004910956136882305, -0.011672889813780785, 0.00623727310448885, -0.008401092141866684, 0.0025744230952113867, -0.0016147171845659614, -0.006214461755007505, 0.019122423604130745, -0.0045492337085306644, 0.01762339286506176, -0.009789325296878815, -0.027686452493071556, -0.010147788561880589, -0.008238153532147408, 0.012103047221899033, -0.01923973858356476, 0.019682930782437325, 0.003825788153335452, 0.020465033128857613, -0.0005666174693033099, 0.011581644415855408, -0.01274176500737667, -0.017923198640346527, 0.01804051361978054, -0.011894485913217068, -0.017988374456763268, -0.019487405195832253, 0.006934648379683495, -0.02054324373602867, -0.00210841977968812, -0.024492865428328514, -0.023632552474737167, 0.008283776231110096, 0.028129644691944122, 0.014325523748993874, 0.01860102079808712, 0.0033988901413977146, -0.03691527247428894, 0.005044565536081791, 0.002971992129459977, 0.005090188235044479, -0.004910956136882305, -0.003923551179468632, -0.0018477188423275948, -0.019761141389608383, -0.011021137237548828, 0.0005401400267146528, 0.009404790587723255, 0.019904525950551033, 0.016841288655996323, 0.005611590575426817, 0.0008334286976605654, 0.042520344257354736, -0.0031218952499330044, 0.00965245719999075, 0.015798484906554222, -0.010708296671509743, -0.0007328144274652004, -0.005337854381650686, -0.026500264182686806, 0.010962479747831821, 0.015967940911650658, 0.031675178557634354, 0.022420290857553482, 0.018288180232048035, 0.012630966491997242, -0.011822793632745743, -0.01045411266386509, 0.021885855123400688, 0.028885677456855774, -0.009352650493383408, 0.0015593182761222124, -0.017232339829206467, 0.014859960414469242, -0.011620749719440937, 0.021559977903962135, 0.016176501289010048, -0.026656683534383774, -0.021690329536795616, 0.005986348260194063, -0.026526333764195442, -0.0005417693755589426, -0.03245728090405464, -0.014755680225789547, 0.001968292985111475, -0.037384532392024994, -0.008062180131673813, -0.013673771172761917, -0.02612224593758583, 0.01271569449454546, -0.00778192700818181, -0.0008643869659863412, -0.021586047485470772, 0.017858022823929787, 0.02828606590628624, -0.014221243560314178, 0.004239650908857584, -0.026721859350800514, 0.002259952249005437, 1.1405672012188006e-05, 0.01529011782258749, -0.00635784724727273, 0.011268803849816322, 0.010056543163955212, -0.0018460893770679832, -0.0270346999168396, 0.006765192840248346, -0.010838646441698074, 0.026982560753822327, 0.009287475608289242, 0.013699840754270554, 0.007175796665251255, -0.010473665781319141, 0.052009861916303635, -0.042598553001880646, 0.03136233985424042, 0.005898361559957266, -0.028338205069303513, 0.03107556700706482, 0.03900087997317314, 0.008518407121300697, 0.003913774620741606, -0.015511712990701199, 0.0101021658629179, 0.00029797316528856754, -0.003741060383617878, 0.0053117843344807625, -0.019539544358849525, 0.0021833714563399553, 0.009404790587723255, 0.009222299791872501, -0.02243332751095295, -0.0019748106133192778, 0.006559890694916248, 0.004011537879705429, -0.025744229555130005, 0.0023283862974494696, -0.017375726252794266, 0.03433433175086975, -0.0022860225290060043, 0.0005381032824516296, -0.016332922503352165, 0.035142503678798676, 0.03352615609765053, 0.02548353001475334, -0.04460595175623894, -0.024701425805687904, 0.0024668837431818247, 0.0010436190059408545, 0.0237629022449255, -0.01268310658633709, 0.0005666174693033099, -0.019265808165073395, 0.016606658697128296, 0.005165139678865671, -0.004422141704708338, 0.011333978734910488, 0.00022709506447426975, -0.008394574746489525, -0.013843226246535778, 0.01643720269203186, 0.008414126932621002, -0.006276377942413092, -0.0016416020225733519, 0.01839246042072773, -0.0037997181061655283, 0.00818601343780756, -0.008140390738844872, 0.007547295652329922, 0.0220031701028347, -0.004014796577394009, -0.014208207838237286, -0.6482071280479431, -0.009359167888760567, -0.0030583494808524847, -0.016059186309576035, -0.01327620167285204, 0.03240514174103737, -0.0009051215020008385, 0.0007169279269874096, -0.031049497425556183, -0.005168398842215538, -0.024271268397569656, 0.013315306976437569, 0.011092830449342728, -0.002391932299360633, -0.0022012945264577866, -0.006139510311186314, 0.018757442012429237, -0.01720627024769783, -0.025274967774748802, 0.031388409435749054, -0.013008982874453068, 0.016750043258070946, -0.011027654632925987, -0.0032734277192503214, 0.004330896306782961, -0.004337414167821407, 0.021964065730571747, -0.003978949971497059, 0.0024359256494790316, 0.012005284428596497, 0.006452351342886686, 0.004643737804144621, 0.0035162055864930153, 0.0004468579136300832, 0.03840126842260361, -0.004516645800322294, -0.029589571058750153, 0.01880958117544651, -0.016424167901277542, 0.007429980207234621, -0.024571076035499573, -0.01645023748278618, -0.010649638250470161, -0.008094768039882183, -0.00988708809018135, 0.001180486986413598, 0.017310550436377525, -0.0010762065649032593, 0.013647700659930706, -0.01686735823750496, 0.008355469442903996, -0.022394221276044846, 0.011646820232272148, 0.01900510862469673, -0.008192530833184719, -0.021690329536795616, 0.026356877759099007, -0.0025630174204707146, 0.0019471111008897424, 0.02312418445944786, 0.01978721097111702, 0.002766689984127879, -0.0197741761803627, -0.04546626657247543, -0.010362867265939713, -0.006726087536662817, -0.007794961798936129, -0.0034347365144640207, 0.01072784885764122, -0.004787123296409845, 0.02116892673075199, 0.020034877583384514, -0.027425752952694893, 0.016684867441654205, -0.008023075759410858, 0.02054324373602867, 0.019109388813376427, 0.011392636224627495, 0.012070459313690662, 0.008955081924796104, 0.024962127208709717, -0.017923198640346527, -0.008127355948090553, -0.012233397923409939, 0.009600317105650902, 0.016215605661273003, -0.0032131406478583813, -0.02180764451622963, 0.012213844805955887, 0.0003036760026589036, -0.0005959463305771351, -0.007645058911293745, 0.0062014264985919, 0.0012171481503173709, -0.026578472927212715, 0.017440902069211006, 0.015941869467496872, 0.006071076262742281, 0.024831777438521385, -0.025535669177770615, -0.029146378859877586, 0.030084902420639992, 0.008316364139318466, 0.0006794521468691528, 0.02982420101761818, 0.01810568943619728, -0.013165404088795185, 0.017532147467136383, 0.0231893602758646, 0.01929187960922718, 0.01462532952427864, 0.009456931613385677, -0.002088867360725999, -0.0004875924496445805, -0.005406288430094719, -0.024492865428328514, 0.0030436848755925894, 0.003578122239559889, 0.0022941692732274532, -0.004572045058012009, 0.008857319131493568, 0.032222650945186615, 0.016541482880711555, 0.0015405804151669145, -0.013999647460877895, 0.025600844994187355, 0.014025717042386532, -0.004053901415318251, -0.017193235456943512, -0.007651576306670904, 0.022407256066799164, -0.00815342552959919, 0.0012627707328647375, -0.017088955268263817, -0.005112999584525824, 0.01208349410444498, 0.022250836715102196, -0.0022697285749018192, 0.01274176500737667, -0.0320662297308445, 0.017245374619960785, -0.016072221100330353, -0.007019376382231712, -0.007755856495350599, -0.008876871317625046, -0.01218777522444725, 0.01267658919095993, 0.0017629909561946988, -0.014468909241259098, 0.0006252751918509603, 0.006067817099392414, -0.020165227353572845, 0.004024572670459747, 0.021612118929624557, 0.03933979198336601, 0.019761141389608383, -0.008948564529418945, -0.012422406114637852, 0.01466443482786417, -0.004070195369422436, 0.02458411082625389, 0.02466232143342495, -0.012050907127559185, 0.0035618282854557037, -0.01410392764955759, -0.015798484906554222, -0.016215605661273003, -0.0021426368039101362, -0.026800069957971573, -0.039391931146383286, 0.012767834588885307, -0.011171041056513786, -0.0024554780684411526, -0.00667068874463439, 0.010512770153582096, -0.012063941918313503, -0.015615994110703468, -0.01069526094943285, 0.006797780282795429, -0.007410428021103144, -0.012005284428596497, 0.013373964466154575, 0.001373568782582879, -0.00381275312975049, 0.029850272461771965, -0.0007405539508908987, 0.006960718426853418, 0.031101636588573456, -0.015264047309756279, 0.03099735639989376, 0.013465209864079952, 0.015994010493159294, -0.011855380609631538, 0.0031447065994143486, -0.016776112839579582, 0.012148669920861721, -0.011262286454439163, 0.0007466641254723072, -0.041764311492443085, 0.023098114877939224, 0.0008464637794531882, 0.004849039949476719, 0.022485466673970222, -0.007240972016006708, 0.028651047497987747, -0.0036921787541359663, 0.0015088074142113328, -0.027086840942502022, 0.0035455345641821623, 0.012044388800859451, 0.0004305641050450504, -0.023671656847000122, 0.0020725734066218138, -0.003903998527675867, 0.013132816180586815, 0.012611414305865765, -0.000723852775990963, -0.005813633557409048, -0.031179847195744514, 0.019344018772244453, 0.008818213827908039, -0.001016734167933464, 0.016463272273540497, -0.013934471644461155, -0.014012682251632214, -0.014129998162388802, -0.00042771268635988235, 0.04577910900115967, 0.013061122968792915, -0.023176325485110283, 0.0024424430448561907, 0.0073778401128947735, 0.006849920377135277, 0.013686805963516235, -0.0041451468132436275, -0.019474370405077934, 0.015980975702404976, -0.03579425811767578, 0.02402360364794731, -0.015277082100510597, 0.029016029089689255, 0.022198695689439774, 0.0249490924179554, -0.005735423415899277, 0.015707239508628845, 0.0009214153396897018, 0.01041500736027956, -0.0043602255173027515, -0.024571076035499573, 0.0020937554072588682, 0.0056441780179739, -0.002338162623345852, -0.015355292707681656, 0.004288532305508852, 0.015394398011267185, -0.021651223301887512, 0.007162761874496937, 0.008564029820263386, 0.03548141568899155, 0.035064294934272766, 0.004050642717629671, 0.02006094716489315, 0.011744583025574684, 0.0014118591789156199, 0.0006692685419693589, 0.015902765095233917, -0.009417826309800148, -0.036133166402578354, -0.00842716172337532, -0.02828606590628624, -0.006954201031476259, -0.01163378544151783, -0.0025744230952113867, -0.01239633560180664, -0.010858199559152126, -0.01658058725297451, 0.01334137748926878, -0.00651426799595356, -0.008726968429982662, 0.0014387440169230103, -0.01860102079808712, -0.026721859350800514, 0.00811432022601366, -0.003408666467294097, -0.0030550905503332615, 0.013035053387284279, -0.006282895803451538, 0.026161352172493935, -0.022811343893408775, 0.0225767120718956, 0.013113263994455338, 0.01651541329920292, 0.01048670057207346, -0.0016244935104623437, -0.00786665454506874, 0.01124925073236227, 0.04502307251095772, -0.020178262144327164, 0.01923973858356476, 0.011177558451890945, 0.0024196316953748465, -0.0002961401187349111, 0.007527743466198444, -0.022263871505856514, 0.02695648930966854, -0.008694380521774292, 0.0010786507045850158, -0.01742786541581154, 0.008485820144414902, -0.018366390839219093, -0.029563501477241516, -0.008407609537243843, -0.002360973972827196, -0.004920732695609331, 0.0242321640253067, -0.007130173966288567, 0.004295050166547298, 0.016280781477689743, 0.01776677742600441, 0.013165404088795185, 0.0213905218988657, -0.02626563236117363, -0.004673066549003124, 0.014025717042386532, 0.05474722385406494, 0.035272855311632156, 0.021090716123580933, 0.008375021629035473, -0.0051064821891486645, -0.0049598379991948605, -0.03232693299651146, -0.002015545032918453, 0.021612118929624557, 0.007273559924215078, -0.008896423503756523, 0.011549057438969612, 0.0022746168542653322, -0.021911924704909325, 0.026656683534383774, -0.017714638262987137, -0.01218777522444725, -0.002259952249005437, 0.0270346999168396, -0.03204016014933586, 0.013608595356345177, 0.02368469163775444, -0.005406288430094719, 0.024753566831350327, 0.04439739137887955, 0.03582032769918442, 0.008577064611017704, 0.008029593154788017, 0.020947331562638283, -0.013113263994455338, 0.016137395054101944, 0.0079448651522398, -0.021064646542072296, -0.0006590848788619041, -0.019591685384511948, 0.0124028529971838, 0.0175451822578907, -0.0004207878082524985, -0.015394398011267185, 0.016332922503352165, 0.016345957294106483, -0.004894662648439407, -0.005077153444290161, 0.007755856495350599, 0.013934471644461155, -0.02339792065322399, -0.016059186309576035, 0.01582455448806286, -0.010662673972547054, -0.00735177006572485, 0.011347013525664806, 0.032848335802555084, -0.0010762065649032593, -0.011861898936331272, 0.01699770987033844, -0.012422406114637852, -0.02479267120361328, -0.015146732330322266, -0.014781750738620758, 0.014716574922204018, -0.011444777250289917, 0.01414303295314312, -0.0025353177916258574, 0.003149594645947218, -0.01922670379281044, 0.011444777250289917, -0.029850272461771965, 0.000311619252897799, -0.04431918263435364, -0.020113086327910423, 0.007325700018554926, -0.006116698961704969, -0.007240972016006708, 0.01727144606411457, 0.030137043446302414, 0.008766073733568192, -0.004353707656264305, 0.0011902633123099804, 0.006471903994679451, 0.02466232143342495, 0.003263651393353939, -0.04562268778681755, 0.013725911267101765, 0.0014631847152486444, 0.011386118829250336, 0.023841112852096558, 0.0012090011732652783, -0.007560330908745527, -0.019539544358849525, 0.007456050254404545, 0.0034836179111152887, 0.019630789756774902, 0.009176677092909813, -0.027138980105519295, 0.0046958778984844685, -0.018835652619600296, -0.03394328057765961, 0.010252069681882858, -0.004031090065836906, -0.00703892856836319, -0.0065077501349151134, -0.006325259804725647, -0.0035618282854557037, -0.027112910524010658, -0.0019894749857485294, 0.027764663100242615, -0.012076976709067822, -0.004510128404945135, 0.0024848070461302996, -0.020047912374138832, -0.005148846190422773, -0.00151939841452986, -0.0042363922111690044, -0.002147525083273649, -0.006419763900339603, 0.05211414396762848, 0.024505900219082832, 0.006146027706563473, 0.024558041244745255, 0.012357230298221111, 0.004314602818340063, -0.019487405195832253, 0.03099735639989376, 0.002768319332972169, 0.0020122863352298737, 0.024427689611911774, 0.016632728278636932, 0.007416945416480303, 0.01804051361978054, 0.0014314118307083845, 0.010330279357731342, 0.015055486932396889, -0.031805530190467834, -0.013178438879549503, 0.007925312034785748, 0.003239210695028305, 0.012005284428596497, 0.007097586523741484, -0.021129820495843887, -0.0383230559527874, -0.021586047485470772, 4.597911538439803e-05, 0.00783406663686037, 0.002620045794174075, -0.009984850883483887, -0.02862497791647911, -0.007403910160064697, 0.004545975010842085, 0.01132094394415617, 0.04395420104265213, -0.007618988864123821, -0.003444512840360403, -0.03183159977197647, 0.008296811021864414, -0.014612294733524323, -0.014859960414469242, -0.03881838917732239, -0.002668927190825343, 0.008577064611017704, 0.04048687592148781, 0.012898185290396214, -0.008094768039882183, 0.03550748527050018, -0.024271268397569656, 0.0072800773195922375, -0.003011097200214863, -0.0033630437683314085, -0.020882155746221542, -0.0034542891662567854, 0.006647877395153046, 0.021768538281321526, 0.024219129234552383, 0.04418883100152016, -0.013171921484172344, 0.0013580896193161607, 0.005829927511513233, -0.013139333575963974, -0.006031970959156752, -0.007983970455825329, -0.02870318666100502, 0.010525805875658989, -0.012650519609451294, -0.020465033128857613, -0.011184075847268105, -0.004200546070933342, -0.007658093702048063, 0.007456050254404545, -0.008994187228381634, 0.0353771336376667, 0.003881187178194523, 0.028807468712329865, -0.018757442012429237, 0.017388761043548584, 9.929044608725235e-05, -0.022589746862649918, -0.031101636588573456, -0.02333274483680725, -0.02381504327058792, -0.008029593154788017, -0.004461247008293867, 0.0032832040451467037, -0.008948564529418945, -0.02075180411338806, -0.011575127020478249, -0.016332922503352165, 0.015967940911650658, -0.0014916989021003246, -0.017923198640346527, -0.010747401043772697, -0.019943632185459137, -0.024127883836627007, -0.006168839056044817, 0.013817156665027142, 0.006641359534114599, 0.010219481773674488, -0.014521049335598946, -0.022733133286237717, 0.012624449096620083, 0.023945393040776253, -0.02028254233300686, -0.009163642302155495, -0.02145569771528244, 0.03217051178216934, 0.022342082113027573, 0.03550748527050018, 0.024818740785121918, 0.01602008007466793, -0.01880958117544651, 0.01386929675936699, -0.005034789443016052, 0.00679126288741827, -0.00843367911875248, 0.01624167710542679, 0.009502554312348366, 0.002898670034483075, -0.013712876476347446, 0.01525101251900196, -0.018979037180542946, -0.023032939061522484, 0.008844283409416676, -0.003685661358758807, 0.0266045443713665, -0.016945568844676018, 0.004715430550277233, -0.02618742175400257, 0.008518407121300697, -0.03037167340517044, -0.0023397919721901417, 0.006348071154206991, 0.00032791306148283184, -0.016176501289010048, 0.01839246042072773, -0.028755327686667442, 0.04682191088795662, 0.002160560106858611, -0.00029817683389410377, -0.02228994108736515, 0.002409855369478464, -0.032926544547080994, -0.0034608065616339445, 0.011164522729814053, 0.0037443190813064575, 0.011086313053965569, 0.006501232739537954, 0.005383477080613375, -0.0002690516412258148, -0.009756737388670444, -0.024688391014933586, 0.00040877112769521773, 0.02076484076678753, -0.011379601433873177, -0.015602958388626575, -0.014312488958239555, -0.012637483887374401, 0.017453936859965324, 0.003982208669185638, -0.009789325296878815, -0.0102455522865057, -0.028677117079496384, 0.0017841729568317533, -0.015994010493159294, -0.022316010668873787, -0.010089131072163582, -0.035012152045965195, 0.0014061563415452838, -0.03704562038183212, 0.0013515721075236797, 0.010597498156130314, 0.0017890611197799444, -0.006364364642649889, -0.020100051537156105, -0.022472431883215904, 0.025183722376823425, -0.013569490052759647, 0.0039496212266385555, -0.01768856681883335, -0.004060419276356697, 0.05062814801931381, -0.004920732695609331, 0.008909459225833416, 0.004239650908857584, 0.010590980760753155, -0.01615043170750141, 0.004800158552825451, -0.0034119251649826765, -0.02799929492175579, -0.0002653855481185019, -0.021194996312260628, -0.03316117450594902, -0.012591861188411713, 0.033812928944826126, -0.011242733336985111, -0.0242321640253067, -0.0089876689016819, -0.00604174705222249, 0.01065615564584732, 0.03190981224179268, -0.018340319395065308, -0.05495578423142433, 0.009137572720646858, -0.026669718325138092, -0.006126475054770708, 0.00659899553284049, -0.012813457287847996, -0.006889025680720806, 0.0041060419753193855, 0.008407609537243843, 0.018418530002236366, -0.019330983981490135, 0.01609829068183899, -0.011868416331708431, 0.01383019145578146, -0.0018558657029643655, -0.009404790587723255, -0.006823850329965353, -0.02103857509791851, -0.02132534794509411, 0.018196934834122658, -0.002561388071626425, -0.00035215012030676007, -0.01191403903067112, 0.0277907345443964, 0.02647419273853302, 0.033395808190107346, -0.009991368278861046, -0.028312135487794876, -0.020373787730932236, -0.02089519053697586, -0.027425752952694893, -0.021090716123580933, -0.01658058725297451, 0.03308296576142311, 0.030893076211214066, 4.508804704528302e-05, -0.025731194764375687, -0.010473665781319141, -0.006139510311186314, -0.00468610180541873, 0.008251188322901726, -0.0030974545516073704, 0.010343315079808235, -0.022759202867746353, 0.010871234349906445, 0.03858375921845436, -0.018653161823749542, 0.008818213827908039, -0.004920732695609331, -0.016398096457123756, -0.007847102358937263, 0.0016578958602622151, -0.003366302466019988, 0.003486876841634512, -0.030084902420639992, -0.04575303569436073, 0.006889025680720806, 0.009952262975275517, 0.016528448089957237, 0.025535669177770615, -0.028546767309308052, -0.0104801831766963, 0.0029198520351201296, 0.004620926454663277, 0.017584286630153656, 0.007723269052803516, 0.011086313053965569, -0.013139333575963974, -0.018627090379595757, 0.006973753683269024, 0.017088955268263817, -0.008915976621210575, -0.029146378859877586, 0.002144266152754426, -0.011770653538405895, 0.012924255803227425, 0.0005287343519739807, 0.0004383036575745791, -0.003747577778995037, -0.010643120855093002, 0.00437000161036849, -0.022602781653404236, 0.0010322133312001824, 0.004578562453389168, -0.01466443482786417, 0.003045314224436879, 0.0007258895202539861, 0.02403663843870163, 0.0001911468425532803, 0.018718335777521133, 0.010030473582446575, -0.01784498803317547, 0.011151487939059734, -0.009176677092909813, 0.0006224237731657922, -0.021651223301887512, -0.021416593343019485, -0.017167165875434875, -0.007658093702048063, -0.008296811021864414, 0.00821860134601593, 0.010851682163774967, -0.007273559924215078, -0.024075742810964584, 0.020256472751498222, -0.017310550436377525, -0.0013874184805899858, -0.01624167710542679, 0.009483001194894314, -0.0028530473355203867, -0.007918794639408588, -0.00043708161683753133, -0.009222299791872501, -0.01818390004336834, 0.027399681508541107, -0.00786665454506874, 0.0062014264985919, 0.008622687309980392, 0.2204488217830658, -0.02528800256550312, 0.007807997055351734, 0.009183195419609547, 0.009900122880935669, 0.0038160118274390697, 0.01274828240275383, 0.011373084038496017, 0.02195102907717228, 0.027112910524010658, 0.008277258835732937, -0.0135173499584198, -0.01096899714320898, 0.0015242865774780512, 0.010643120855093002, -0.00815342552959919, -0.06913792341947556, -0.009698079898953438, -0.027503961697220802, -0.01664576306939125, 0.024753566831350327, 0.009430861100554466, 0.013347894884645939, -0.021755503490567207, 0.054173681885004044, 0.023775937035679817, 0.0013491279678419232, -0.002354456577450037, 0.01957865059375763, 0.004862074740231037, -0.022967763245105743, -0.019956666976213455, 0.006980271078646183, -0.0028481590561568737, -0.005200986284762621, 0.002082349732518196, 0.028129644691944122, -0.021638188511133194, 0.034933943301439285, -0.0047056544572114944, -0.014286418445408344, -0.014208207838237286, 0.033604368567466736, -0.027503961697220802, 0.0021524131298065186, 0.028520695865154266, -0.010291174985468388, -0.005751717370003462, 0.008381539024412632, 0.019461333751678467, -0.009013739414513111, -0.03253549337387085, 0.021990135312080383, 0.007130173966288567, 0.016828253865242004, 0.01651541329920292, 0.0067717102356255054, -0.01132094394415617, 0.023802006617188454, 0.012546238489449024, -0.010252069681882858, 0.04046080633997917, -0.05015888437628746, 0.010988550260663033, -0.023306675255298615, -0.00254346476867795, 0.0016701162094250321, 0.004708913154900074, 0.04246820509433746, -0.03120591677725315, -0.014899065718054771, -0.043093886226415634, 0.025731194764375687, 0.029485290870070457, -0.007801479194313288, -0.008596617728471756, 0.018236039206385612, 0.002991544781252742, 0.016489341855049133, 0.007019376382231712, -0.00937220361083746, 0.006465386599302292, -0.01302201859652996, -0.03568997606635094, -0.006432798691093922, -0.04262462258338928, -0.0028546766843646765, 0.004611149895936251, 0.013908402062952518, -0.006468645296990871, -0.004431918263435364, -0.0018656420288607478, -0.019461333751678467, -0.007208384573459625, -0.0008594988030381501, 0.0362374484539032, -0.013725911267101765, 0.01264400128275156, -0.0023837853223085403, -0.0011234586127102375, 0.024336444213986397, 0.02828606590628624, 0.006660912185907364, 0.00359767465852201, -0.020451998338103294, -0.007117139175534248, -0.007807997055351734, 0.006022194400429726, -0.0033695611637085676, -0.0041940282098948956, 0.019591685384511948, -0.00288237608037889, 0.017466971650719643, -0.00381275312975049, -0.012930773198604584, -0.003232693299651146, 0.00421358086168766, -0.00722793722525239, -0.003802976803854108, 0.0060743349604308605, 0.0314926877617836, -0.02012612298130989, 0.02485784702003002, 0.010545358061790466, 0.01775374263525009, 0.014377663843333721, -0.010291174985468388, -0.022485466673970222, 0.02180764451622963, -0.053808700293302536, 0.04270283505320549, 0.0019161528907716274, -0.022407256066799164, -0.017167165875434875, -0.009346133098006248, -0.0004643737629521638, 0.003825788153335452, -0.0048685926012694836, -0.00679126288741827, -0.016176501289010048, -0.011575127020478249, 0.008075215853750706, 0.028520695865154266, -0.005807116162031889, 0.01929187960922718, -0.025587810203433037, -0.029719920828938484, -0.006139510311186314, -0.016541482880711555, -0.017036814242601395, -0.011672889813780785, -0.009196230210363865, -0.01837942562997341, -0.020191296935081482, -0.0002525541640352458, -0.0013165404088795185, -0.02668275497853756, -0.03297868371009827, 0.007247489411383867, -0.007599436212331057, -0.01295684278011322, -0.026591509580612183, 0.02870318666100502, 0.008049145340919495, -0.017597321420907974, 0.0013703099684789777, -0.16403311491012573, 0.010669191367924213, 0.00030449070618487895, -0.01243544090539217, 0.006370882503688335, -0.005477981176227331, 0.026109211146831512, 0.0008871983154676855, -0.00958076398819685, 0.001053395215421915, 0.03342187777161598, -0.0010566540295258164, -0.02124713733792305, -0.00746908551082015, 0.009489518590271473, -0.006305707152932882, -0.015967940911650658, 0.0022192178294062614, 0.021859783679246902, 0.014690505340695381, 0.012891667895019054, -0.0004112152091693133, 0.018157828599214554, 0.009202747605741024, 0.012103047221899033, 0.01804051361978054, -0.003646556055173278, 0.00663484213873744, -0.02745182253420353, -0.009776289574801922, 0.0009067509090527892, -0.022602781653404236, 0.039809051901102066, -0.00022017020091880113, -0.008668310008943081, -0.021025540307164192, 0.028859607875347137, -0.009750219993293285, 0.005842962767928839, 0.015915799885988235, -0.00012464770406950265, 0.019135458394885063, 0.013413069769740105, 0.03743667155504227, 0.03321331739425659, 0.0005279196775518358, 0.039887264370918274, 0.0044905757531523705, 0.005895102862268686, -0.012285538017749786, 0.014925136230885983, -0.031388409435749054, -0.02341095544397831, -0.01791016384959221, 0.005158622283488512, 0.015902765095233917, -0.011060242541134357, 0.0033695611637085676, -0.008818213827908039, 0.006380658596754074, 0.011197110638022423, -0.022798309102654457, -0.012461510486900806, 0.009176677092909813, 0.009150607511401176, -0.01720627024769783, -0.010753919370472431, -0.0016244935104623437, 0.001290470245294273, 0.008831248618662357, -0.0014004535041749477, -0.0202043317258358, 0.003178923623636365, 0.0014615553664043546, 0.01630685105919838, -0.0009002333972603083, -0.01073436625301838, -0.01246802881360054, 0.0029638451524078846, -0.011210145428776741, -0.009150607511401176, 0.01441676914691925, -0.026526333764195442, -0.00012098158913431689, -0.013321824371814728, 0.00703892856836319, -0.00539977103471756, 0.002985027153044939, 0.036602430045604706, -0.005256385076791048, 0.03318724408745766, -0.01418213825672865, -0.024883916601538658, -0.02416698820888996, 0.0017124800942838192, 0.013426104560494423, 0.0175451822578907, -0.009776289574801922, 0.008244670927524567, -0.005891844164580107, 0.0037508364766836166, 0.012624449096620083, -0.0020367270335555077, 0.03164910897612572, 0.03469931334257126, 0.0034640654921531677, -0.015055486932396889, 0.0034901355393230915, 0.011164522729814053, 0.0036107096821069717, 0.018209969624876976, 0.034386470913887024, 0.01383019145578146, 0.027816804125905037, 0.002100273035466671, 0.028937818482518196, -0.022446362301707268, -0.0014794785529375076, -0.002708032261580229, 0.01887475699186325, 0.030919145792722702, -0.010819094255566597, 0.0019324466120451689, 0.02485784702003002, -0.014886030927300453, -0.0058103748597204685, -0.1134571060538292, -0.0209603663533926, 0.01643720269203186, 0.02285044826567173, -0.02278527244925499, 0.0027813545893877745, 0.0021328607108443975, 0.01867923140525818, -0.019265808165073395, -0.004578562453389168, -0.02167729288339615, -0.01650237664580345, -0.0024734013713896275, -0.0026901091914623976, 0.01783195324242115, 0.02403663843870163, -0.014429803937673569, 0.0014558525290340185, -0.01887475699186325, 0.017115024849772453, -0.0017727672820910811, -0.0213905218988657, -0.012507133185863495, -0.02577030099928379, -0.009952262975275517, -0.01068874355405569, -0.016763078048825264, -0.0065664080902934074, 0.02084304951131344, 0.012754799798130989, -0.018353354185819626, -0.03029346466064453, 0.0069672358222305775, -0.016319885849952698, -0.017180200666189194, -0.0009654086316004395, -0.030084902420639992, 0.0062014264985919, 0.005983089562505484, -0.0006753787165507674, 0.0025288003962486982, -0.011659855023026466, 0.0115946801379323, -0.044267039746046066, 0.02285044826567173, -0.006830367725342512, -0.027112910524010658, 0.037723444402217865, 0.004330896306782961, -0.01791016384959221, -0.02167729288339615, 0.008199048228561878, -0.0204911045730114, -0.02904209867119789, 0.002198035828769207, -0.02339792065322399, -0.011861898936331272, -0.015615994110703468, -0.01386929675936699, 0.0018460893770679832, 0.0004708913038484752, -0.014312488958239555, -0.03065844625234604, -0.006700017489492893, -0.0014859960647299886, 0.014234278351068497, -0.016815219074487686, -0.0008888277225196362, 0.015107627026736736, 0.004751277156174183, -0.0060743349604308605, 0.011197110638022423, -0.011607714928686619, 0.009639421477913857, -0.008857319131493568, -0.01659362204372883, -0.0377495139837265, 0.0006163135985843837, 0.03141447901725769, -0.015915799885988235, -0.0021898888517171144, -0.02597886137664318, 0.0018574950518086553, 0.0055561913177371025, -0.01069526094943285, 0.015316187404096127, 0.014429803937673569, 0.00647842139005661, 0.02307204343378544, -0.030215254053473473, -0.004275497514754534, 0.0018118723528459668, 0.025040337815880775, -0.013673771172761917, -0.014872996136546135, 0.024049673229455948, 0.002494583372026682, 0.003395631443709135, 0.02919851988554001, -0.016059186309576035, -0.0335782989859581, -0.00548775726929307, -0.035142503678798676, 0.014429803937673569, -0.007390875369310379, -0.048021137714385986, -0.0035944159608334303, 0.005419323220849037, 0.017506076022982597, -0.028859607875347137, -0.005504051223397255, 0.006889025680720806, -0.010669191367924213, 0.026148317381739616, -0.0017206270713359118, 0.01188145112246275, -0.005494275130331516, 0.0018265368416905403, 0.030919145792722702, -0.0012644001981243491, 0.011190593242645264, -0.017884092405438423, -0.012826492078602314, -0.005970054306089878, -0.001634269836358726, -0.0025874581187963486, -0.023580411449074745, 0.03993940353393555, -0.005497533828020096, 0.00018269442080054432, -0.0012163333594799042, -0.03871410712599754, 0.02535317838191986, -0.010701778344810009, 0.011718512512743473, 0.035429276525974274, -0.01658058725297451, -0.03336973488330841, 0.026852209120988846, 0.021012505516409874, 0.0294070802628994, -0.007892725057899952, -0.0031333009246736765, -0.036680638790130615, -0.011268803849816322, -0.014534084126353264, 0.01014127116650343, 0.0021263430826365948, -0.010897304862737656, 0.010271621868014336, 0.005803857464343309, -0.015642063692212105, 0.017258411273360252, 0.00783406663686037, 0.01014127116650343, -0.0362374484539032, -0.0149381710216403, -0.009489518590271473, 0.01671093888580799, -0.0021931477822363377, 0.005536638665944338, -0.016072221100330353, 0.043771710246801376, -0.023358816280961037, -0.002351197646930814, -0.02633080817759037, -0.002222476527094841, -0.007762374356389046, -0.005579002667218447, 0.0071823145262897015, 0.027138980105519295, -0.006986788474023342, -0.026852209120988846, 0.041268978267908096, 0.0025092477444559336, -0.009463449008762836, 0.024636249989271164, 0.0004965540720149875, -0.007684163749217987, -0.013452175073325634, -0.012050907127559185, 0.024571076035499573, 0.027530033141374588, 0.0036041922867298126, -0.017597321420907974, 0.01893993280827999, 0.0017043332336470485, 0.012591861188411713, 0.00731266476213932, 0.006084111053496599, -0.0017466971185058355, 0.013204509392380714, -0.03868803754448891, 0.018770476803183556, 0.007332217413932085, 0.024610180407762527, 0.030397744849324226, -0.01595490612089634, 0.01418213825672865, 0.018079617992043495, 0.01637202687561512, -0.00012403668370097876, 0.011275321245193481, 0.017010744661092758, 0.010701778344810009, -0.001507178065367043, -0.011105865240097046, -0.004008278716355562, -0.031153777614235878, -0.01914849318563938, -0.0016880393959581852, 0.027712523937225342, 0.002748766914010048, -0.015967940911650658, 0.029354939237236977, 0.018223004415631294, -0.015159767121076584, 0.00288400542922318, 0.004858816042542458, -0.011627267114818096, -0.01267658919095993, 0.018353354185819626, -0.002835124032571912, -0.0070258937776088715, 0.024636249989271164, -0.022342082113027573, 0.0017092213965952396, -0.004607891198247671, 0.0006020565051585436, -0.021755503490567207, 0.009163642302155495, -0.002403337974101305, 0.011718512512743473, -0.0009336356888525188, 0.005621366668492556, -0.013360929675400257, -0.0014599260175600648, -0.005634401924908161, 0.004937026649713516, 0.01664576306939125, 0.004389554262161255, 0.07137995213270187, 0.004826228599995375, -0.010617051273584366, -0.014208207838237286, -0.00790575984865427, 0.02592672035098076, 0.021494802087545395, -0.024714460596442223, 0.0002712920540943742, 0.009535141289234161, 0.0656445249915123, -0.0006851549842394888, 0.00783406663686037, -0.017818918451666832, -0.01216170471161604, -0.007397392764687538, -0.008564029820263386, 0.01972203515470028, -0.028937818482518196, -0.01678914949297905, 0.01824907399713993, 0.013999647460877895, 0.020725734531879425, 0.030267393216490746, -0.05839703977108002, -0.002815571613609791, 0.010708296671509743, -0.0170759204775095, 0.015211907215416431, -0.06819939613342285, 0.018236039206385612, 0.006765192840248346, -0.03900087997317314, -0.003705214010551572, -0.012982913292944431, 0.0026510038878768682, -0.006035229656845331, 0.02215959131717682, 0.014051787555217743, 0.007156244479119778, -0.003330456092953682, 0.004532939754426479, -0.012663554400205612, 0.01441676914691925, -0.025340143591165543, -0.001930817263200879, 0.004620926454663277, 0.004985908046364784, -0.02655240334570408]
@@ -0,0 +1,338 @@
+"""
+Background task supervisor
+
+Keeps references to every fire-and-forget job so it can't be garbage-collected mid-flight, applies
+per-job timeouts, records failures, and drains in-flight jobs on shutdown
+"""
+
+import asyncio
+import functools
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Coroutine, Optional, TypedDict
+
+if TYPE_CHECKING:
+    from aiohttp.web import Application
+
+
+class TaskFailure(TypedDict):
+    """
+    Failed or timed out job recorded by :class:`TaskSupervisor`
+    """
+
+    id: str
+    name: str
+    error: str
+    time: float
+
+
+class UncancellableJob(Exception):
+    """
+    Raised by TaskSupervisor if job to cancel is running in worker thread, which can't be
+    interrupted
+    """
+
+
+class TaskSupervisor:
+    # pylint: disable=too-many-instance-attributes
+    """
+    Supervise background jobs on event loop of aiohttp app. Jobs can be spawned from loop or from
+    any other thread. Bind to app lifecycle using :meth:`attach`
+    """
+
+    __loop: Optional[asyncio.AbstractEventLoop]
+    __loop_thread_id: Optional[int]
+    __timeout: float
+    __counter: int
+    __jobs: dict[str, tuple[str, float, "asyncio.Task[Any]"]]
+    __threads: set[str]
+    __executor: ThreadPoolExecutor
+    __counts: dict[str, int]
+    __failures: deque[TaskFailure]
+
+    def __init__(
+        self, *, timeout: float = 120, threads: int = 64, failures_size: int = 50
+    ):
+        self.__loop = None
+        self.__loop_thread_id = None
+        self.__timeout = timeout
+        self.__counter = 0
+        self.__jobs = {}
+        # IDs of thread jobs whose function is running in worker thread
+        self.__threads = set()
+        # Own executor rather than loop default one, which is sized for CPU-bound work. Jobs are
+        # mostly waiting on OpenAI and WhatsApp APIs
+        self.__executor = ThreadPoolExecutor(
+            max_workers=threads, thread_name_prefix="supervisor"
+        )
+        self.__counts = {
+            "started": 0,
+            "succeeded": 0,
+            "failed": 0,
+            "timed_out": 0,
+            "finished_after_timeout": 0,
+            "cancelled": 0,
+        }
+        self.__failures = deque(maxlen=failures_size)
+
+    def attach(self, app: "Application", *, shutdown_timeout: float = 60) -> None:
+        """
+        Store supervisor as `app["supervisor"]`, start it with app, and drain it on app shutdown
+        for up to `shutdown_timeout` seconds
+        """
+
+        async def on_startup(_):
+            self.start()
+
+        async def on_shutdown(_):
+            await self.shutdown(timeout=shutdown_timeout)
+
+        app["supervisor"] = self
+        app.on_startup.append(on_startup)
+        app.on_shutdown.append(on_shutdown)
+
+    def start(self) -> None:
+        """
+        Bind supervisor to running event loop. Must be called from loop
+        """
+
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_thread_id = threading.get_ident()
+
+    def spawn(
+        self,
+        coro_func: Callable[..., Coroutine[Any, Any, Any]],
+        /,
+        *,
+        name: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Run `coro_func(**kwargs)` as supervised job on loop. Safe to call from any thread. Job is
+        cancelled after `timeout` seconds, defaulting to supervisor timeout
+
+        :raises RuntimeError: If supervisor is not started
+        """
+
+        self.__dispatch(coro_func, name, timeout, kwargs, False)
+
+    def run_in_thread(
+        self,
+        func: Callable[..., Any],
+        /,
+        *,
+        name: str,
+        timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Run blocking `func(**kwargs)` in worker thread of supervisor as supervised job. Safe to
+        call from any thread. Timeout counts from when `func` starts running in its thread, not
+        while it waits for free thread. Timing out stops waiting for the thread, but can't
+        interrupt it
+
+        :raises RuntimeError: If supervisor is not started
+        """
+
+        self.__dispatch(func, name, timeout, kwargs, True)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel in-flight job. Returns `False` if there's no such job. Must be called from loop
+
+        :raises UncancellableJob: If job is running in worker thread
+        """
+
+        if job_id not in self.__jobs:
+            return False
+
+        if job_id in self.__threads:
+            raise UncancellableJob(f"Job '{job_id}' is running in worker thread")
+
+        return self.__jobs[job_id][2].cancel()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Counts of jobs by outcome, in-flight jobs and most recent failures. Must be called from loop
+        """
+
+        now = time.monotonic()
+
+        return {
+            **self.__counts,
+            "in_flight": len(self.__jobs),
+            "jobs": [
+                {
+                    "id": job_id,
+                    "name": name,
+                    "age": round(now - started, 3),
+                    "in_thread": job_id in self.__threads,
+                }
+                for job_id, (name, started, _) in self.__jobs.items()
+            ],
+            "failures": list(self.__failures),
+        }
+
+    async def shutdown(self, *, timeout: float = 60) -> None:
+        """
+        Wait for in-flight jobs, including ones they spawn meanwhile, for up to `timeout` seconds,
+        then cancel remaining jobs. Jobs running in worker threads can't be cancelled, so their
+        threads are waited for up to another `timeout` seconds
+        """
+
+        deadline = time.monotonic() + timeout
+
+        while self.__jobs and (remaining := deadline - time.monotonic()) > 0:
+            logging.info("Waiting for %s in-flight background jobs", len(self.__jobs))
+            await asyncio.wait(
+                [task for _, _, task in self.__jobs.values()], timeout=remaining
+            )
+
+        if self.__jobs:
+            logging.warning("Cancelling %s in-flight background jobs", len(self.__jobs))
+            tasks = [task for _, _, task in self.__jobs.values()]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+        # Threads still running finish their work, e.g. marking journal entries as completed,
+        # before app cleanup closes what they use
+        waiting = asyncio.create_task(
+            asyncio.to_thread(self.__executor.shutdown, wait=True, cancel_futures=True)
+        )
+        if not (await asyncio.wait([waiting], timeout=timeout))[0]:
+            logging.error("Worker threads are still running after %ss", timeout)
+
+    def __dispatch(  # pylint: disable=too-many-arguments
+        self,
+        func: Callable[..., Any],
+        name: str,
+        timeout: Optional[float],
+        kwargs: dict[str, Any],
+        in_thread: bool,
+    ) -> None:
+        if self.__loop is None:
+            raise RuntimeError("TaskSupervisor is not started")
+
+        if threading.get_ident() == self.__loop_thread_id:
+            self.__spawn(func, name, timeout, kwargs, in_thread)
+            return
+
+        self.__loop.call_soon_threadsafe(
+            self.__spawn, func, name, timeout, kwargs, in_thread
+        )
+
+    def __spawn(  # pylint: disable=too-many-arguments
+        self,
+        func: Callable[..., Any],
+        name: str,
+        timeout: Optional[float],
+        kwargs: dict[str, Any],
+        in_thread: bool,
+    ) -> None:
+        self.__counter += 1
+        # Job ID is used as URL path segment by tasks endpoints, so it must be URL-safe
+        job_id = f"{name}-{self.__counter}"
+
+        # Coroutine is created inside job, so a job cancelled before it first runs leaves no
+        # coroutine that is never awaited
+        task = asyncio.create_task(
+            self.__run(
+                job_id,
+                name,
+                functools.partial(func, **kwargs),
+                self.__timeout if timeout is None else timeout,
+                in_thread,
+            ),
+            name=job_id,
+        )
+        self.__jobs[job_id] = (name, time.monotonic(), task)
+        self.__counts["started"] += 1
+        task.add_done_callback(functools.partial(self.__done, job_id))
+
+    def __done(self, job_id: str, task: "asyncio.Task[Any]") -> None:
+        self.__jobs.pop(job_id, None)
+
+        # Counted here rather than in __run, as job cancelled before it first runs never enters it
+        if task.cancelled():
+            self.__counts["cancelled"] += 1
+            logging.warning("Background job '%s' was cancelled", job_id)
+
+    async def __run(  # pylint: disable=too-many-arguments
+        self,
+        job_id: str,
+        name: str,
+        func: Callable[[], Any],
+        timeout: float,
+        in_thread: bool,
+    ) -> None:
+        try:
+            if in_thread:
+                await self.__run_thread(job_id, func, timeout)
+            else:
+                await asyncio.wait_for(func(), timeout)
+        except asyncio.TimeoutError as e:
+            self.__counts["timed_out"] += 1
+            self.__record_failure(job_id, name, e)
+            logging.error("Background job '%s' timed out after %ss", job_id, timeout)
+        except Exception as e:  # pylint: disable=broad-except
+            self.__counts["failed"] += 1
+            self.__record_failure(job_id, name, e)
+            logging.exception("Background job '%s' failed with error: %s", job_id, e)
+        else:
+            self.__counts["succeeded"] += 1
+
+    async def __run_thread(
+        self, job_id: str, func: Callable[[], Any], timeout: float
+    ) -> None:
+        loop = asyncio.get_running_loop()
+        started = loop.create_future()
+
+        def target() -> Any:
+            loop.call_soon_threadsafe(_set_started, started)
+            return func()
+
+        future = loop.run_in_executor(self.__executor, target)
+
+        # Waiting for free thread isn't timed. Job cancelled meanwhile is removed from executor
+        # queue and never runs
+        try:
+            await started
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+
+        self.__threads.add(job_id)
+        try:
+            # Shielded, as cancelling future of running thread can't stop the thread
+            await asyncio.wait_for(asyncio.shield(future), timeout)
+        except asyncio.TimeoutError:
+            future.add_done_callback(functools.partial(self.__done_late, job_id))
+            raise
+        finally:
+            self.__threads.discard(job_id)
+
+    def __done_late(self, job_id: str, future: "asyncio.Future[Any]") -> None:
+        self.__counts["finished_after_timeout"] += 1
+        if not future.cancelled() and (error := future.exception()) is not None:
+            logging.error(
+                "Background job '%s' failed after timing out with error: %s",
+                job_id,
+                error,
+            )
+        else:
+            logging.warning("Background job '%s' finished after timing out", job_id)
+
+    def __record_failure(self, job_id: str, name: str, error: BaseException) -> None:
+        self.__failures.append(
+            {"id": job_id, "name": name, "error": repr(error), "time": time.time()}
+        )
+
+
+def _set_started(future: "asyncio.Future[None]") -> None:
+    if not future.done():
+        future.set_result(None)
@@ -0,0 +1,55 @@
+"""
+Endpoints '/tasks' and '/tasks/{id}' handlers
+"""
+
+import json
+from typing import TYPE_CHECKING
+
+from aiohttp.web import Response
+
+from ._shared import is_admin_request
+from ._supervisor import UncancellableJob
+
+if TYPE_CHECKING:
+    from aiohttp.web import Request
+
+    from ._supervisor import TaskSupervisor
+
+
+async def tasks_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for tasks endpoint. Lists background jobs counts, in-flight jobs and recent failures.
+    Used for debugging. Requires admin token. NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not is_admin_request(request):
+        return Response(status=403, text="Invalid token")
+
+    supervisor: "TaskSupervisor" = request.app["supervisor"]
+
+    return Response(
+        headers={"Content-Type": "application/json; charset=utf-8"},
+        text=json.dumps(supervisor.stats()),
+    )
+
+
+async def task_delete_endpoint_handler(request: "Request") -> "Response":
+    """
+    Handler for task DELETE endpoint. Cancels in-flight background job, unless it's running in
+    worker thread. Requires admin token. NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not is_admin_request(request):
+        return Response(status=403, text="Invalid token")
+
+    supervisor: "TaskSupervisor" = request.app["supervisor"]
+
+    try:
+        if not supervisor.cancel(request.match_info["id"]):
+            return Response(status=404, text="Task not found")
+    except UncancellableJob:
+        return Response(
+            status=409, text="Task is running in worker thread and can't be cancelled"
+        )
+
+    return Response(text="Task cancelled")
@@ -2,28 +2,32 @@
 Endpoint '/webhook' handler and associated classes
 """
 
-import asyncio
 import json
 import logging
 import os
-import threading
+import sqlite3
+import time
 from abc import ABC, abstractmethod
 from copy import deepcopy
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Optional
 
 import openai
 import requests
 from aiohttp.web import Response
 from openai.embeddings_utils import cosine_similarity
 
+from ._menu_index import InvalidMenuItem, normalise_name
+from ._response_cache import cache_key
 from ._shared import (ITEM_CREATE_VICTOR, JSON_PROMPT, MENU, MESSAGES,
-                      SYSTEM_PROMPT)
+                      RESPONSE_CACHE, SYSTEM_PROMPT)
 from .sql_reporting_northwind import nl_to_sql
 
 if TYPE_CHECKING:
-    from aiohttp.web import Request
+    from aiohttp.web import Application, Request
 
+    from ._journal import JournalEntry
     from ._shared import Message
+    from ._supervisor import TaskSupervisor
 
 
 def get_embedding(text):
@@ -68,69 +72,154 @@ async def webhook_post_endpoint_handler(request: "Request") -> "Response":
 
     match event.message:
         case WebhookEventMessageTextModel():
+            # Journal message before acknowledging it, as WhatsApp API doesn't redeliver
+            # acknowledged events should Backend stop before replying
+            entry = None
+            if journal := request.app.get("journal"):
+                try:
+                    entry = await journal.append(
+                        phone_number=event.phone_number, message=event.message.text
+                    )
+                except sqlite3.Error as e:
+                    logging.error("Failed to journal message with error: %s", e)
+                    return Response(status=500, text="Failed to journal message")
+
             response_status = 200
-            asyncio.create_task(
-                process_message(
-                    phone_number=event.phone_number,
-                    message=event.message.text,
-                )
+            supervisor: "TaskSupervisor" = request.app["supervisor"]
+            supervisor.spawn(
+                process_message,
+                name="process_message",
+                supervisor=supervisor,
+                phone_number=event.phone_number,
+                message=event.message.text,
+                entry=entry,
             )
 
     return Response(status=response_status)
 
 
-async def process_message(*, phone_number: str, message: str) -> None:
+async def replay_journal(app: "Application") -> None:
+    """
+    Startup handler. Processes messages journaled but not replied to before Backend last stopped.
+    NOT SUPPOSED TO BE INVOKED OUTSIDE OF AIOHTTP CONTEXT
+    """
+
+    if not (journal := app.get("journal")):
+        return
+
+    supervisor: "TaskSupervisor" = app["supervisor"]
+
+    for entry in await journal.recover():
+        logging.info(
+            "Replaying journaled message '%s' from '%s'", entry.entry_id, entry.phone_number
+        )
+        supervisor.spawn(
+            process_message,
+            name="process_message",
+            supervisor=supervisor,
+            phone_number=entry.phone_number,
+            message=entry.message,
+            entry=entry,
+        )
+
+
+async def process_message(
+    *,
+    supervisor: "TaskSupervisor",
+    phone_number: str,
+    message: str,
+    entry: Optional["JournalEntry"],
+) -> None:
     """
     Primitively process message against general or data query
 
     This function is invoked as first act after receiving a message on event on webhook. A message
-    is data query if prefixed by "data: " or else a general query
+    is data query if prefixed by "data: " or else a general query. Journal `entry` of message, if
+    any, is completed once reply is sent
     """
 
     if message.startswith("data: "):
-        asyncio.create_task(
-            process_message_data(phone_number=phone_number, message=message)
+        supervisor.spawn(
+            process_message_data,
+            name="process_message_data",
+            supervisor=supervisor,
+            phone_number=phone_number,
+            message=message,
+            entry=entry,
         )
         return
 
-    thread = threading.Thread(
-        target=process_message_general,
-        kwargs={"phone_number": phone_number, "message": message},
+    supervisor.run_in_thread(
+        process_message_general,
+        name="process_message_general",
+        supervisor=supervisor,
+        phone_number=phone_number,
+        message=message,
+        entry=entry,
     )
-    thread.start()
 
 
-def process_message_general(*, phone_number: str, message: str) -> None:
+def process_message_general(
+    *,
+    supervisor: "TaskSupervisor",
+    phone_number: str,
+    message: str,
+    entry: Optional["JournalEntry"],
+) -> None:
     """
     Send message to OpenAI API to generate general response
 
     This function is invoked as second act of receiving a message of general query. Message is
     prefixed with last 9 messages sent from same phone number in order to generate contextual
-    response
+    response. Runs in worker thread supervised by `supervisor`
     """
 
     if phone_number not in MESSAGES:
         MESSAGES[phone_number] = []
 
-    if phone_number not in MENU:
-        MENU[phone_number] = []
+    MENU.ensure(phone_number)
 
     MESSAGES[phone_number].append({"role": "user", "content": message})
 
+    menu_json = MENU.dumps(phone_number)
+    # First message of conversation has no context other than menu, so its response can be shared
+    # with other users asking same question against same menu
+    cacheable = len(MESSAGES[phone_number]) == 1
+
     def complete_gpt(messages: list["Message"]):
-        answer = openai.ChatCompletion.create(
-            model="gpt-4",
-            messages=messages,
-        )
-        response_text = answer["choices"][0]["message"]["content"]
+        cached_text: Optional[str] = None
+
+        if cacheable:
+            embedding = get_embedding(normalise_name(message))
+            key = cache_key(menu_json=menu_json, message=message)
+            cached_text = RESPONSE_CACHE.lookup(embedding, key=key)
+
+        if cached_text is not None:
+            response_text = cached_text
+        else:
+            started = time.monotonic()
+            answer = openai.ChatCompletion.create(
+                model="gpt-4",
+                messages=messages,
+            )
+            response_text = answer["choices"][0]["message"]["content"]
+
+            if cacheable:
+                RESPONSE_CACHE.store(
+                    embedding,
+                    key=key,
+                    response=response_text,
+                    latency=time.monotonic() - started,
+                )
 
         MESSAGES[phone_number].append({"role": "assistant", "content": response_text})
 
-        thread = threading.Thread(
-            target=send_message,
-            kwargs={"phone_number": phone_number, "message": response_text},
+        send_message(
+            supervisor=supervisor,
+            phone_number=phone_number,
+            message=response_text,
+            entry=entry,
         )
-        thread.start()
 
         # Find catch words
         if cosine_similarity(ITEM_CREATE_VICTOR, get_embedding(response_text)) > 0.85:
@@ -143,19 +232,24 @@ def process_message_general(*, phone_number: str, message: str) -> None:
             json_str = response_text.split("```")[1]
             if json_str.startswith("json"):
                 json_str = json_str.replace("json", "", 1)
-            item = json.loads(json_str)
-            MENU[phone_number].append(item)
+            try:
+                MENU.upsert(phone_number, json.loads(json_str))
+            except (json.JSONDecodeError, InvalidMenuItem) as e:
+                logging.error("Failed to create menu item with error: %s", e)
+                failure = "Failed to create item. Please, check item details and try again."
+                MESSAGES[phone_number].append({"role": "assistant", "content": failure})
+                send_message(
+                    supervisor=supervisor, phone_number=phone_number, message=failure
+                )
+                return
             MESSAGES[phone_number].append(
                 {"role": "assistant", "content": "Item has been created."}
             )
-            thread = threading.Thread(
-                target=send_message,
-                kwargs={
-                    "phone_number": phone_number,
-                    "message": "Item has been created.",
-                },
+            send_message(
+                supervisor=supervisor,
+                phone_number=phone_number,
+                message="Item has been created.",
             )
-            thread.start()
             return
 
         if "fetching menu items" in response_text.lower():
@@ -163,36 +257,35 @@ def process_message_general(*, phone_number: str, message: str) -> None:
                 {
                     "role": "assistant",
                     "content": "Here are your menu items, JSON formatted: "
-                    + json.dumps(MENU[phone_number]),
+                    + MENU.dumps(phone_number),
                 }
             )
-            asyncio.create_task(
-                send_message(
-                    phone_number=phone_number,
-                    message="Here are your menu items, JSON formatted: "
-                    + json.dumps(MENU[phone_number]),
-                )
+            send_message(
+                supervisor=supervisor,
+                phone_number=phone_number,
+                message="Here are your menu items, JSON formatted: "
+                + MENU.dumps(phone_number),
             )
             return
 
-    thread = threading.Thread(
-        target=complete_gpt,
-        kwargs={
-            "messages": [
-                {"role": "system", "content": SYSTEM_PROMPT},
-                {
-                    "role": "user",
-                    "content": "Current menu is, note that prices are in cents and preparation time is in minutes: "
-                    + json.dumps(MENU[phone_number]),
-                },
-            ]
-            + MESSAGES[phone_number][-10:]
+    messages: list["Message"] = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": "Current menu is, note that prices are in cents and preparation time is in minutes: "
+            + menu_json,
         },
-    )
-    thread.start()
+    ]
+    complete_gpt(messages + MESSAGES[phone_number][-10:])
 
 
-async def process_message_data(*, phone_number: str, message: str) -> None:
+async def process_message_data(
+    *,
+    supervisor: "TaskSupervisor",
+    phone_number: str,
+    message: str,
+    entry: Optional["JournalEntry"],
+) -> None:
     """
     Send message to OpenAI API to format SQL query out of natural-language text and execute it
     against Database
@@ -201,34 +294,54 @@ async def process_message_data(*, phone_number: str, message: str) -> None:
     """
 
     result = await nl_to_sql(message.replace("data: ", ""))
-    asyncio.create_task(send_message(phone_number=phone_number, message=f"{result}"))
+    send_message(
+        supervisor=supervisor,
+        phone_number=phone_number,
+        message=f"{result}",
+        entry=entry,
+    )
 
 
-def send_message(*, phone_number: str, message: str) -> None:
+def send_message(
+    *,
+    supervisor: "TaskSupervisor",
+    phone_number: str,
+    message: str,
+    entry: Optional["JournalEntry"] = None,
+) -> None:
     """
     Report response of received message to runtime Output
 
     If runtime Output (Set with env variable `OUTPUT`) is set to `WHATSAPP`,
-    :func:`send_message_whatsapp` will be invoked, else response will be logged to `stdout`
+    :func:`send_message_whatsapp` will be invoked in worker thread supervised by `supervisor`, else
+    response will be logged to `stdout`. Journal `entry`, if any, is completed once reported.
+    Safe to call from any thread
     """
 
     if os.getenv("OUTPUT") == "WHATSAPP":
-        thread = threading.Thread(
-            target=send_message_whatsapp,
-            kwargs={"phone_number": phone_number, "message": message},
+        supervisor.run_in_thread(
+            send_message_whatsapp,
+            name="send_message_whatsapp",
+            phone_number=phone_number,
+            message=message,
+            entry=entry,
         )
-        thread.start()
         return
 
     logging.info("Response to message from '%s' is: %s", phone_number, message)
 
+    if entry:
+        entry.complete()
+
 
-def send_message_whatsapp(*, phone_number: str, message: str) -> None:
+def send_message_whatsapp(
+    *, phone_number: str, message: str, entry: Optional["JournalEntry"] = None
+) -> None:
     """
     Send WhatsApp message using WhatsApp API
 
     This function is invoked as as final act of processing a message should Backend be set to Output
-    to WhatsApp
+    to WhatsApp. Journal `entry`, if any, is completed only if message was sent successfully
     """
 
     r = requests.post(
@@ -254,6 +367,10 @@ def send_message_whatsapp(*, phone_number: str, message: str) -> None:
             r.status_code,
             r.text,
         )
+        return
+
+    if entry:
+        entry.complete()
 
 
 class InvalidWebhookEvent(Exception):